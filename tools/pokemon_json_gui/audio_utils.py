@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import mmap
 import re
 from pathlib import Path
 from typing import List
@@ -16,10 +18,15 @@ except ImportError:  # pragma: no cover - executed when run as a script
 
     import project_paths  # type: ignore
 
-CRY_RE = re.compile(r"cry(?:_reverse)?\s+(Cry_[A-Za-z0-9_]+)")
+CRY_RE = re.compile(rb"cry(?:_reverse)?\s+(Cry_[A-Za-z0-9_]+)")
 
 
+@functools.lru_cache(maxsize=1)
 def load_available_cries() -> List[str]:
-    text = project_paths.CRY_TABLE_PATH.read_text(encoding="utf-8")
-    cries = sorted(set(match.group(1) for match in CRY_RE.finditer(text)))
-    return cries
+    path = project_paths.CRY_TABLE_PATH
+    if path.stat().st_size == 0:
+        # mmap cannot map an empty file.
+        return []
+    with path.open("rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as text:
+            return sorted({match.group(1).decode("ascii") for match in CRY_RE.finditer(text)})
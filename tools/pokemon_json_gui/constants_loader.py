@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import functools
+import mmap
+import operator
+import os
+import pickle
 import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, MutableMapping, Optional, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Set, Tuple, TypeVar, Union
 
 try:
     from . import project_paths
+    from .audio_utils import load_available_cries
 except ImportError:  # pragma: no cover - executed when run as a script
     import sys
 
@@ -16,21 +25,31 @@ except ImportError:  # pragma: no cover - executed when run as a script
         sys.path.insert(0, module_dir)
 
     import project_paths  # type: ignore
+    from audio_utils import load_available_cries  # type: ignore
 
 
-DEFINE_RE = re.compile(r"#define\s+(\w+)\s+([^/\n]+)")
-ENUM_ENTRY_RE = re.compile(r"^(\s*)([A-Z0-9_]+)\s*(?:=\s*([^,]+))?,?")
-SPECIES_NAME_RE = re.compile(r"\[\s*(SPECIES_[A-Z0-9_]+)\s*][^[]+?\.speciesName\s*=\s*_\(\"([^\"]+)\"\)", re.DOTALL)
-HEIGHT_RE = re.compile(r"\.height\s*=\s*(\d+)")
-WEIGHT_RE = re.compile(r"\.weight\s*=\s*(\d+)")
-FAMILY_MACRO_RE = re.compile(r"#define\s+(P_FAMILY_[A-Z0-9_]+)\s+")
-FAMILY_IF_RE = re.compile(r"#if\s+(P_FAMILY_[A-Z0-9_]+)")
-FAMILY_ELIF_RE = re.compile(r"#elif\s+(P_FAMILY_[A-Z0-9_]+)")
+DEFINE_RE = re.compile(r"^#define[ \t]+(\w+)[ \t]+([^/\n]+)", re.MULTILINE | re.ASCII)
+SPECIES_BLOCK_RE = re.compile(rb"\[\s*(SPECIES_[A-Z0-9_]+)\s*][^[]*")
+SPECIES_NAME_RE = re.compile(rb"\.speciesName\s*=\s*_\(\"([^\"]+)\"\)")
+HEIGHT_RE = re.compile(rb"\.height\s*=\s*(\d+)")
+WEIGHT_RE = re.compile(rb"\.weight\s*=\s*(\d+)")
+FAMILY_MACRO_RE = re.compile(r"#define\s+(P_FAMILY_[A-Z0-9_]+)\s+", re.ASCII)
+FAMILY_IF_RE = re.compile(r"#if\s+(P_FAMILY_[A-Z0-9_]+)", re.ASCII)
+FAMILY_ELIF_RE = re.compile(r"#elif\s+(P_FAMILY_[A-Z0-9_]+)", re.ASCII)
 SPECIES_MARKER = "[SPECIES_"
 IDENTIFIER_RE = re.compile(r"[A-Z][A-Z0-9_]*")
+_ENUM_RE_CACHE: Dict[str, re.Pattern[str]] = {}
+_DEFINE_RE_CACHE: Dict[str, re.Pattern[str]] = {}
+DISK_CACHE_PATH = project_paths.CACHE_DIR / "constants.pkl"
 
+T = TypeVar("T")
+FileKey = Tuple[Tuple[str, int, int], ...]
+_disk_cache: Optional[Dict[str, Tuple[FileKey, Any]]] = None
+# Loaders run on several GUI worker threads; re-entrant because a compute may load another constant.
+_disk_cache_lock = threading.RLock()
 
-@dataclass
+
+@dataclass(slots=True)
 class SpeciesMetadata:
     species_constant: str
     display_name: str
@@ -38,76 +57,139 @@ class SpeciesMetadata:
     weight: Optional[int]
 
 
+def _file_key(paths: Iterable[Union[str, Path]]) -> FileKey:
+    key = []
+    for path in paths:
+        stat = os.stat(path)
+        key.append((os.fspath(path), stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+
+def _read_disk_cache() -> Dict[str, Tuple[FileKey, Any]]:
+    global _disk_cache
+    if _disk_cache is None:
+        try:
+            with DISK_CACHE_PATH.open("rb") as handle:
+                loaded = pickle.load(handle)
+        except Exception:  # Missing, truncated, or pickled under another module name.
+            loaded = {}
+        _disk_cache = loaded if isinstance(loaded, dict) else {}
+    return _disk_cache
+
+
+def _disk_cached(name: str, paths: Iterable[Union[str, Path]], compute: Callable[[], T]) -> T:
+    key = _file_key(paths)
+    with _disk_cache_lock:
+        cache = _read_disk_cache()
+        entry = cache.get(name)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        value = compute()
+        cache[name] = (key, value)
+        snapshot = dict(cache)
+        temp_name: Optional[str] = None
+        try:
+            DISK_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=DISK_CACHE_PATH.parent, suffix=".tmp", delete=False) as handle:
+                temp_name = handle.name
+                pickle.dump(snapshot, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_name, DISK_CACHE_PATH)
+        except Exception:  # pragma: no cover - the disk cache is best effort
+            if temp_name is not None:
+                try:
+                    os.unlink(temp_name)
+                except OSError:
+                    pass
+    return value
+
+
+def _parse_define_constants(path: Path, prefix: str) -> Dict[str, str]:
+    pattern = _DEFINE_RE_CACHE.get(prefix)
+    if pattern is None:
+        pattern = re.compile(
+            rf"^#define[ \t]+({re.escape(prefix)}\w*)[ \t]+([^/\n]+)",
+            re.MULTILINE | re.ASCII,
+        )
+        _DEFINE_RE_CACHE[prefix] = pattern
+    text = path.read_text(encoding="utf-8")
+    return {name: value.strip() for name, value in pattern.findall(text)}
+
+
+@functools.lru_cache(maxsize=None)
 def _load_define_constants(path: Path, prefix: str) -> Dict[str, str]:
-    constants: Dict[str, str] = {}
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            match = DEFINE_RE.match(line)
-            if not match:
-                continue
-            name, value = match.groups()
-            if not name.startswith(prefix):
-                continue
-            constants[name] = value.strip()
-    return constants
+    return _disk_cached(
+        f"define:{path}:{prefix}", (path,), lambda: _parse_define_constants(path, prefix)
+    )
 
 
+@functools.lru_cache(maxsize=1)
 def load_species_constants() -> Dict[str, str]:
     return _load_define_constants(project_paths.SPECIES_HEADER_PATH, "SPECIES_")
 
 
+@functools.lru_cache(maxsize=1)
 def load_national_dex_constants() -> Dict[str, str]:
     return _load_define_constants(project_paths.NATIONAL_DEX_HEADER_PATH, "NATIONAL_DEX_")
 
 
+@functools.lru_cache(maxsize=1)
 def load_move_constants() -> Dict[str, str]:
     return _load_define_constants(project_paths.MOVES_HEADER_PATH, "MOVE_")
 
 
+@functools.lru_cache(maxsize=1)
 def load_ability_constants() -> Dict[str, str]:
     return _load_define_constants(project_paths.ABILITIES_HEADER_PATH, "ABILITY_")
 
 
+@functools.lru_cache(maxsize=1)
 def load_item_constants() -> Dict[str, str]:
     return _load_define_constants(project_paths.ITEMS_HEADER_PATH, "ITEM_")
 
 
+@functools.lru_cache(maxsize=1)
 def load_type_constants() -> Dict[str, str]:
     return _load_define_constants(project_paths.TYPES_HEADER_PATH, "TYPE_")
 
 
-def _load_enum_constants(prefix: str) -> List[str]:
+def _parse_enum_constants(prefix: str) -> List[str]:
+    pattern = _ENUM_RE_CACHE.get(prefix)
+    if pattern is None:
+        pattern = re.compile(rf"^\s*({re.escape(prefix)}[A-Z0-9_]+)", re.ASCII)
+        _ENUM_RE_CACHE[prefix] = pattern
     constants: List[str] = []
     with project_paths.POKEMON_HEADER_PATH.open("r", encoding="utf-8") as handle:
-        inside_enum = False
-        for raw_line in handle:
-            line = raw_line.rstrip()
-            if prefix in line:
-                inside_enum = True
-            if inside_enum:
-                match = ENUM_ENTRY_RE.match(line)
-                if match:
-                    _, name, _ = match.groups()
-                    if name.startswith(prefix):
-                        constants.append(name)
-            if inside_enum and line.startswith("}"):
-                inside_enum = False
+        for line in handle:
+            match = pattern.match(line)
+            if match:
+                constants.append(match.group(1))
     return constants
 
 
+def _load_enum_constants(prefix: str) -> List[str]:
+    return _disk_cached(
+        f"enum:{prefix}",
+        (project_paths.POKEMON_HEADER_PATH,),
+        lambda: _parse_enum_constants(prefix),
+    )
+
+
+@functools.lru_cache(maxsize=1)
 def load_evolution_methods() -> List[str]:
     return _load_enum_constants("EVO_")
 
 
+@functools.lru_cache(maxsize=1)
 def load_growth_rates() -> List[str]:
     return _load_enum_constants("GROWTH_")
 
 
+@functools.lru_cache(maxsize=1)
 def load_egg_groups() -> List[str]:
     return _load_enum_constants("EGG_GROUP_")
 
 
-def load_family_macros() -> List[str]:
+def _parse_family_macros() -> List[str]:
     macros: List[str] = []
     with project_paths.SPECIES_ENABLED_PATH.open("r", encoding="utf-8") as handle:
         for line in handle:
@@ -117,13 +199,20 @@ def load_family_macros() -> List[str]:
     return macros
 
 
-def load_species_family_mapping() -> Dict[str, str]:
+@functools.lru_cache(maxsize=1)
+def load_family_macros() -> List[str]:
+    return _disk_cached(
+        "family_macros", (project_paths.SPECIES_ENABLED_PATH,), _parse_family_macros
+    )
+
+
+def _parse_species_family_mapping(paths: List[str]) -> Dict[str, str]:
     mapping: Dict[str, str] = {}
-    for path in project_paths.SPECIES_INFO_DIR.glob("**/*.h"):
-        if not path.is_file():
-            continue
+    for path in paths:
         current_family: Optional[str] = None
-        for line in path.read_text(encoding="utf-8").splitlines():
+        with open(path, "r", encoding="utf-8") as handle:
+            lines = handle.read().splitlines()
+        for line in lines:
             stripped = line.strip()
             family_match = FAMILY_IF_RE.match(stripped)
             if family_match:
@@ -144,6 +233,13 @@ def load_species_family_mapping() -> Dict[str, str]:
     return mapping
 
 
+def load_species_family_mapping() -> Dict[str, str]:
+    paths = _species_info_paths()
+    return _disk_cached(
+        "species_family_mapping", paths, lambda: _parse_species_family_mapping(paths)
+    )
+
+
 def _resolve_define(
     name: str,
     defines: Mapping[str, str],
@@ -200,7 +296,7 @@ def _resolve_define(
     return result
 
 
-def load_enabled_family_macros() -> List[str]:
+def _parse_enabled_family_macros() -> List[str]:
     defines: Dict[str, str] = {}
     with project_paths.SPECIES_ENABLED_PATH.open("r", encoding="utf-8") as handle:
         for line in handle:
@@ -221,27 +317,127 @@ def load_enabled_family_macros() -> List[str]:
     return enabled
 
 
-def load_species_metadata() -> Dict[str, SpeciesMetadata]:
+def load_enabled_family_macros() -> List[str]:
+    return _disk_cached(
+        "enabled_family_macros",
+        (project_paths.SPECIES_ENABLED_PATH,),
+        _parse_enabled_family_macros,
+    )
+
+
+def _iter_h_files(root: str) -> Iterator[str]:
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield from _iter_h_files(entry.path)
+            elif entry.name.endswith(".h") and entry.is_file():
+                yield entry.path
+
+
+def _scan_one_species_file(path: str) -> List[Tuple[str, SpeciesMetadata]]:
+    entries: List[Tuple[str, SpeciesMetadata]] = []
+    if os.stat(path).st_size == 0:
+        # mmap cannot map an empty file.
+        return entries
+    with open(path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as text:
+            # Each block runs from its [SPECIES_*] marker up to the next "[", so the
+            # per-field searches never look past the entry they belong to.
+            for match in SPECIES_BLOCK_RE.finditer(text):
+                start, end = match.span()
+                name_match = SPECIES_NAME_RE.search(text, start, end)
+                if not name_match:
+                    continue
+                species = match.group(1).decode("ascii")
+                height_match = HEIGHT_RE.search(text, start, end)
+                weight_match = WEIGHT_RE.search(text, start, end)
+                entries.append(
+                    (
+                        species,
+                        SpeciesMetadata(
+                            species_constant=species,
+                            display_name=name_match.group(1).decode("utf-8"),
+                            height=int(height_match.group(1)) if height_match else None,
+                            weight=int(weight_match.group(1)) if weight_match else None,
+                        ),
+                    )
+                )
+    return entries
+
+
+def _parse_species_metadata(paths: List[str]) -> Dict[str, SpeciesMetadata]:
     metadata: Dict[str, SpeciesMetadata] = {}
-    for path in project_paths.SPECIES_INFO_DIR.glob("**/*.h"):
-        text = path.read_text(encoding="utf-8")
-        for match in SPECIES_NAME_RE.finditer(text):
-            species, display = match.groups()
-            block = text[match.start():]
-            # Limit block search to avoid capturing the entire rest of the file.
-            end_index = block.find("\n}\n")
-            snippet = block[: end_index if end_index != -1 else len(block)]
-            height_match = HEIGHT_RE.search(snippet)
-            weight_match = WEIGHT_RE.search(snippet)
-            metadata[species] = SpeciesMetadata(
-                species_constant=species,
-                display_name=display,
-                height=int(height_match.group(1)) if height_match else None,
-                weight=int(weight_match.group(1)) if weight_match else None,
-            )
+    with ThreadPoolExecutor() as executor:
+        # map() yields in submission order, so later headers still win on duplicates.
+        for entries in executor.map(_scan_one_species_file, paths):
+            metadata.update(entries)
     return metadata
 
 
+def load_species_metadata() -> Dict[str, SpeciesMetadata]:
+    paths = _species_info_paths()
+    return _disk_cached("species_metadata", paths, lambda: _parse_species_metadata(paths))
+
+
+def _species_info_paths() -> List[str]:
+    return list(_iter_h_files(str(project_paths.SPECIES_INFO_DIR)))
+
+
+def project_headers_key() -> FileKey:
+    """Stat key of the headers behind the family and species loaders; changes when they are edited."""
+    return _file_key([project_paths.SPECIES_ENABLED_PATH, *_species_info_paths()])
+
+
+_project_records_cache: Optional[Tuple[FileKey, List[Tuple[str, str, str]]]] = None
+
+
+def load_species_project_records() -> List[Tuple[str, str, str]]:
+    """(species, display name, family macro) per family species, sorted by display name."""
+    global _project_records_cache
+    key = _file_key(_species_info_paths())
+    cached = _project_records_cache
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    metadata = load_species_metadata()
+    records: List[Tuple[str, str, str]] = []
+    for species, family in load_species_family_mapping().items():
+        meta = metadata.get(species)
+        records.append((species, meta.display_name if meta else species, family))
+    records.sort(key=operator.itemgetter(1, 0))
+    _project_records_cache = (key, records)
+    return records
+
+
+_cache_generation = 0
+
+
+def constant_cache_generation() -> int:
+    """Incremented by clear_constant_caches; lets callers notice reloaded constants."""
+    return _cache_generation
+
+
+def clear_constant_caches() -> None:
+    """Drop cached loader results so the next call re-reads the project headers."""
+    global _cache_generation, _project_records_cache
+    _cache_generation += 1
+    _project_records_cache = None
+    _load_define_constants.cache_clear()
+    for loader in (
+        load_species_constants,
+        load_national_dex_constants,
+        load_move_constants,
+        load_ability_constants,
+        load_item_constants,
+        load_type_constants,
+        load_evolution_methods,
+        load_growth_rates,
+        load_egg_groups,
+        load_family_macros,
+        load_available_cries,
+    ):
+        loader.cache_clear()
+
+
 def ensure_constant_exists(constants: Dict[str, str], constant: str) -> None:
     if constant not in constants:
         raise ValueError(f"Unknown constant: {constant}")
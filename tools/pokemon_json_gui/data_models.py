@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
-from typing import Any, Dict, List, Mapping, Optional
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
 
 
-@dataclass
-class LearnsetEntry:
+class LearnsetEntry(NamedTuple):
     level: int
     move: str
 
@@ -23,10 +23,10 @@ class LearnsetEntry:
             raise ValueError("Invalid learnset entry level") from exc
         if not isinstance(move, str):  # pragma: no cover - defensive conversion
             raise ValueError("Learnset move must be a string")
-        return cls(level=level, move=move)
+        return cls(level=level, move=sys.intern(move))
 
 
-@dataclass
+@dataclass(slots=True)
 class EvolutionEntry:
     from_species: str
     method: str
@@ -56,15 +56,15 @@ class EvolutionEntry:
         if not isinstance(conditions, list):  # pragma: no cover - defensive conversion
             raise ValueError("Evolution conditions must be a list")
         return cls(
-            from_species=str(from_species),
-            method=str(method),
+            from_species=sys.intern(str(from_species)),
+            method=sys.intern(str(method)),
             parameter=str(parameter),
-            target_species=str(target_species),
+            target_species=sys.intern(str(target_species)),
             conditions=[str(condition) for condition in conditions],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PokemonData:
     species_constant: str
     family_macro: str
@@ -149,10 +149,36 @@ class PokemonData:
         return dict(self.dex_order_hint)
 
     def to_summary(self) -> Dict[str, object]:
-        summary = asdict(self)
-        summary["learnset_level_up"] = [entry.to_dict() for entry in self.learnset_level_up]
-        summary["evolutions"] = [entry.to_dict() for entry in self.evolutions]
-        return summary
+        return {
+            "species_constant": self.species_constant,
+            "family_macro": self.family_macro,
+            "national_dex_constant": self.national_dex_constant,
+            "display_name": self.display_name,
+            "category_name": self.category_name,
+            "description": self.description,
+            "height": self.height,
+            "weight": self.weight,
+            "types": list(self.types),
+            "abilities": list(self.abilities),
+            "catch_rate": self.catch_rate,
+            "exp_yield": self.exp_yield,
+            "growth_rate": self.growth_rate,
+            "egg_groups": list(self.egg_groups),
+            "gender_ratio": self.gender_ratio,
+            "egg_cycles": self.egg_cycles,
+            "friendship": self.friendship,
+            "base_stats": dict(self.base_stats),
+            "ev_yield": dict(self.ev_yield),
+            "learnset_level_up": [entry.to_dict() for entry in self.learnset_level_up],
+            "learnset_egg": list(self.learnset_egg),
+            "learnset_tm": list(self.learnset_tm),
+            "evolutions": [entry.to_dict() for entry in self.evolutions],
+            "dex_order_hint": dict(self.dex_order_hint),
+            "cry": self.cry,
+            "graphics_folder": self.graphics_folder,
+            "icon_pal_index": self.icon_pal_index,
+            "extra_graphics": dict(self.extra_graphics),
+        }
 
     @classmethod
     def from_dict(cls, payload: Mapping[str, Any]) -> "PokemonData":
@@ -188,31 +214,31 @@ class PokemonData:
                 raise ValueError("icon_pal_index must be an integer") from exc
 
         return cls(
-            species_constant=str(require("species_constant")),
-            family_macro=str(require("family_macro")),
-            national_dex_constant=str(require("national_dex_constant")),
+            species_constant=sys.intern(str(require("species_constant"))),
+            family_macro=sys.intern(str(require("family_macro"))),
+            national_dex_constant=sys.intern(str(require("national_dex_constant"))),
             display_name=str(require("display_name")),
             category_name=str(require("category_name")),
             description=str(require("description")),
             height=height,
             weight=weight,
-            types=[str(value) for value in payload.get("types", [])],
-            abilities=[str(value) for value in payload.get("abilities", [])],
+            types=[sys.intern(str(value)) for value in payload.get("types", [])],
+            abilities=[sys.intern(str(value)) for value in payload.get("abilities", [])],
             catch_rate=int(require("catch_rate")),
             exp_yield=int(require("exp_yield")),
-            growth_rate=str(require("growth_rate")),
-            egg_groups=[str(value) for value in payload.get("egg_groups", [])],
-            gender_ratio=str(require("gender_ratio")),
+            growth_rate=sys.intern(str(require("growth_rate"))),
+            egg_groups=[sys.intern(str(value)) for value in payload.get("egg_groups", [])],
+            gender_ratio=sys.intern(str(require("gender_ratio"))),
             egg_cycles=int(require("egg_cycles")),
-            friendship=str(require("friendship")),
-            base_stats={str(key): int(value) for key, value in require("base_stats").items()},
-            ev_yield={str(key): int(value) for key, value in require("ev_yield").items()},
+            friendship=sys.intern(str(require("friendship"))),
+            base_stats={sys.intern(str(key)): int(value) for key, value in require("base_stats").items()},
+            ev_yield={sys.intern(str(key)): int(value) for key, value in require("ev_yield").items()},
             learnset_level_up=learnset_level,
-            learnset_egg=[str(value) for value in payload.get("learnset_egg", [])],
-            learnset_tm=[str(value) for value in payload.get("learnset_tm", [])],
+            learnset_egg=[sys.intern(str(value)) for value in payload.get("learnset_egg", [])],
+            learnset_tm=[sys.intern(str(value)) for value in payload.get("learnset_tm", [])],
             evolutions=evolutions,
             dex_order_hint={str(k): int(v) for k, v in dex_hint.items()},
-            cry=str(require("cry")),
+            cry=sys.intern(str(require("cry"))),
             graphics_folder=str(require("graphics_folder")),
             icon_pal_index=icon_pal_index,
             extra_graphics={str(k): str(v) for k, v in payload.get("extra_graphics", {}).items()},
@@ -2,9 +2,20 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional, Set, Tuple
+from typing import AbstractSet, Any, Iterable, List, Optional, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional speedup
+    msgpack = None  # type: ignore
 
 try:
     from . import project_paths
@@ -23,7 +34,7 @@ except ImportError:  # pragma: no cover - executed when run as a script
     from file_manager import AssetBundle  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class PokemonRecord:
     species_constant: str
     display_name: str
@@ -31,108 +42,216 @@ class PokemonRecord:
     family_macro: Optional[str] = None
 
 
+def _dumps(payload: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload)
+
+
+def _loads(text: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _encode(payload: Any) -> Union[bytes, str]:
+    if msgpack is not None:
+        return msgpack.packb(payload, use_bin_type=True)
+    return _dumps(payload)
+
+
+def _decode(value: Union[bytes, str]) -> Any:
+    # MessagePack entries are stored as BLOBs, JSON entries as TEXT.
+    if isinstance(value, bytes):
+        if msgpack is None:
+            raise RuntimeError(
+                "This database entry is MessagePack-encoded. Please install it with 'pip install msgpack'."
+            )
+        return msgpack.unpackb(value, raw=False)
+    return _loads(value)
+
+
+def _normalize_family(value: object) -> Optional[str]:
+    if isinstance(value, str) and value.strip():
+        return value.strip()
+    return None
+
+
+UPSERT_SQL = """
+    INSERT INTO pokemon (species_constant, display_name, payload, assets, family_macro, updated_at)
+    VALUES (?, ?, ?, ?, ?, datetime('now'))
+    ON CONFLICT(species_constant) DO UPDATE SET
+        display_name=excluded.display_name,
+        payload=excluded.payload,
+        assets=excluded.assets,
+        family_macro=excluded.family_macro,
+        updated_at=datetime('now')
+"""
+
+
 class PokemonDatabase:
     def __init__(self, path: Optional[Path] = None) -> None:
         self.path = Path(path) if path is not None else project_paths.DATABASE_PATH
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._initialize()
+        self._conn = self._connect()
+        # The connection is shared with worker threads; one statement sequence runs at a time.
+        self._lock = threading.RLock()
+        with self._lock:
+            self._initialize()
 
     # ------------------------------------------------------------------
     def _initialize(self) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                CREATE TABLE IF NOT EXISTS pokemon (
-                    species_constant TEXT PRIMARY KEY,
-                    display_name TEXT NOT NULL,
-                    payload TEXT NOT NULL,
-                    assets TEXT NOT NULL,
-                    updated_at TEXT NOT NULL DEFAULT (datetime('now'))
-                )
-                """
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pokemon (
+                species_constant TEXT PRIMARY KEY,
+                display_name TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                assets BLOB NOT NULL,
+                updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+                family_macro TEXT
+            )
+            """
+        )
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(pokemon)")}
+        if "family_macro" not in columns:
+            self._conn.execute("ALTER TABLE pokemon ADD COLUMN family_macro TEXT")
+            self._backfill_family_macros()
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_family ON pokemon(family_macro)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    # ------------------------------------------------------------------
+    def _backfill_family_macros(self) -> None:
+        rows = self._conn.execute("SELECT species_constant, payload FROM pokemon").fetchall()
+        updates: List[Tuple[str, str]] = []
+        for row in rows:
+            try:
+                payload = _decode(row["payload"])
+            except (TypeError, json.JSONDecodeError):  # pragma: no cover - defensive parsing
+                continue
+            family_macro = _normalize_family(payload.get("family_macro"))
+            if family_macro is not None:
+                updates.append((family_macro, row["species_constant"]))
+        if updates:
+            self._conn.executemany(
+                "UPDATE pokemon SET family_macro = ? WHERE species_constant = ?",
+                updates,
             )
 
     # ------------------------------------------------------------------
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.path)
+        # Autocommit mode: single statements commit on their own and bulk
+        # writes open an explicit transaction in save_many().
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
         return conn
 
     # ------------------------------------------------------------------
-    def save_entry(self, pokemon: PokemonData, assets: AssetBundle) -> None:
-        payload = json.dumps(pokemon.to_summary())
-        asset_payload = json.dumps(assets.to_dict())
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO pokemon (species_constant, display_name, payload, assets, updated_at)
-                VALUES (?, ?, ?, ?, datetime('now'))
-                ON CONFLICT(species_constant) DO UPDATE SET
-                    display_name=excluded.display_name,
-                    payload=excluded.payload,
-                    assets=excluded.assets,
-                    updated_at=datetime('now')
-                """,
-                (pokemon.species_constant, pokemon.display_name, payload, asset_payload),
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    def revision(self) -> Tuple[int, int]:
+        """A token that changes whenever this or another connection writes."""
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            return self._conn.total_changes, data_version
+
+    # ------------------------------------------------------------------
+    def get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return None if row is None else row["value"]
+
+    # ------------------------------------------------------------------
+    def set_meta(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value=excluded.value",
+                (key, value),
             )
 
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _entry_params(
+        pokemon: PokemonData, assets: AssetBundle
+    ) -> Tuple[str, str, Union[bytes, str], Union[bytes, str], Optional[str]]:
+        payload = _encode(pokemon.to_summary())
+        asset_payload = _encode(assets.to_dict())
+        return (
+            pokemon.species_constant,
+            pokemon.display_name,
+            payload,
+            asset_payload,
+            _normalize_family(pokemon.family_macro),
+        )
+
+    # ------------------------------------------------------------------
+    def save_entry(self, pokemon: PokemonData, assets: AssetBundle) -> None:
+        params = self._entry_params(pokemon, assets)
+        with self._lock:
+            self._conn.execute(UPSERT_SQL, params)
+
+    # ------------------------------------------------------------------
+    def save_many(self, entries: Iterable[Tuple[PokemonData, AssetBundle]]) -> None:
+        conn = self._conn
+        with self._lock:
+            conn.execute("BEGIN")
+            try:
+                # executemany steps one prepared statement over every row.
+                conn.executemany(UPSERT_SQL, (self._entry_params(pokemon, assets) for pokemon, assets in entries))
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
     # ------------------------------------------------------------------
     def list_entries(
         self,
         *,
         enabled_families: Optional[Iterable[str]] = None,
-        valid_species: Optional[Set[str]] = None,
+        valid_species: Optional[AbstractSet[str]] = None,
     ) -> List[PokemonRecord]:
-        with self._connect() as conn:
-            cursor = conn.execute(
-                """
-                SELECT species_constant, display_name, payload, updated_at
-                FROM pokemon
-                ORDER BY updated_at DESC, species_constant ASC
-                """
-            )
+        query = "SELECT species_constant, display_name, family_macro, updated_at FROM pokemon"
+        params: List[str] = []
+        if enabled_families is not None:
+            params = sorted(set(enabled_families))
+            placeholders = ", ".join("?" for _ in params)
+            # Entries without a family macro are never filtered out.
+            query += f" WHERE family_macro IS NULL OR family_macro IN ({placeholders})"
+        query += " ORDER BY updated_at DESC, species_constant ASC"
+        with self._lock:
+            cursor = self._conn.execute(query, params)
+
             records: List[PokemonRecord] = []
-            enabled_set = set(enabled_families) if enabled_families is not None else None
-            for row in cursor.fetchall():
+            for row in cursor:
                 species_constant = row["species_constant"]
                 if valid_species is not None and species_constant not in valid_species:
                     continue
-
-                family_macro: Optional[str] = None
-                payload_text = row["payload"]
-                if payload_text:
-                    try:
-                        payload = json.loads(payload_text)
-                    except (TypeError, json.JSONDecodeError):  # pragma: no cover - defensive parsing
-                        payload = {}
-                    family_value = payload.get("family_macro")
-                    if isinstance(family_value, str) and family_value:
-                        family_macro = family_value.strip()
-
-                if enabled_set is not None and family_macro is not None and family_macro not in enabled_set:
-                    continue
-
                 records.append(
                     PokemonRecord(
                         species_constant=species_constant,
                         display_name=row["display_name"],
                         updated_at=row["updated_at"],
-                        family_macro=family_macro,
+                        family_macro=row["family_macro"],
                     )
                 )
-            return records
+        return records
 
     # ------------------------------------------------------------------
     def load_entry(self, species_constant: str) -> Tuple[PokemonData, AssetBundle]:
-        with self._connect() as conn:
-            cursor = conn.execute(
+        with self._lock:
+            row = self._conn.execute(
                 "SELECT payload, assets FROM pokemon WHERE species_constant = ?",
                 (species_constant,),
-            )
-            row = cursor.fetchone()
+            ).fetchone()
         if row is None:
             raise KeyError(f"Species {species_constant} not found in database")
 
-        pokemon_payload = json.loads(row["payload"])
-        assets_payload = json.loads(row["assets"])
+        pokemon_payload = _decode(row["payload"])
+        assets_payload = _decode(row["assets"])
         return PokemonData.from_dict(pokemon_payload), AssetBundle.from_dict(assets_payload)
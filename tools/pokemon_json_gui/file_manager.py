@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
 import re
 import shutil
 from dataclasses import dataclass
@@ -41,7 +43,7 @@ OPTIONAL_SIZE_HINTS = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class AssetBundle:
     front: Path
     back: Path
@@ -68,30 +70,27 @@ class AssetBundle:
         optional_raw = payload.get("optional_assets", {})
         if not isinstance(optional_raw, Mapping):  # pragma: no cover - defensive conversion
             raise ValueError("optional_assets must be a mapping")
-        optional_assets = {}
-        for name, raw_path in optional_raw.items():
-            path_str = str(raw_path).strip()
-            if not path_str:
-                continue
-            optional_assets[str(name)] = Path(path_str)
-
-        shiny = payload.get("shiny_palette")
-        cry = payload.get("cry_sample")
-
-        shiny_value = str(shiny).strip() if shiny is not None else ""
-        cry_value = str(cry).strip() if cry is not None else ""
+        optional_assets = {
+            str(name): Path(path_str)
+            for name, raw_path in optional_raw.items()
+            if (path_str := str(raw_path).strip())
+        }
 
-        shiny_path = Path(shiny_value) if shiny_value else None
-        cry_path = Path(cry_value) if cry_value else None
+        def optional_path(key: str) -> Optional[Path]:
+            value = payload.get(key)
+            if value is None:
+                return None
+            stripped = str(value).strip()
+            return Path(stripped) if stripped else None
 
         return cls(
             front=require_path("front"),
             back=require_path("back"),
             icon=require_path("icon"),
             normal_palette=require_path("normal_palette"),
-            shiny_palette=shiny_path,
+            shiny_palette=optional_path("shiny_palette"),
             optional_assets=optional_assets,
-            cry_sample=cry_path,
+            cry_sample=optional_path("cry_sample"),
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -111,18 +110,68 @@ class AssetBundle:
 
 ARRAY_RE_TEMPLATE = r"const u16 {name}\[\] =\s*\{{\n(?P<body>.*?)\n\}};"
 FAMILY_BLOCK_TEMPLATE = r"\.if\s+{macro}\s*==\s*TRUE\s*\n(?P<body>.*?)\n\.endif @ {macro}"
+FAMILY_TOGGLE_TEMPLATE = r"(#define\s+{macro}\s+)([^/\n]+)"
+
+
+POKEDEX_ORDER_ARRAYS = (
+    "gPokedexOrder_Alphabetical",
+    "gPokedexOrder_Height",
+    "gPokedexOrder_Weight",
+)
+
+
+def _compile_array_re(name: str) -> "re.Pattern[str]":
+    return re.compile(ARRAY_RE_TEMPLATE.format(name=re.escape(name)), re.DOTALL)
+
+
+_KNOWN_ARRAY_RES = {name: _compile_array_re(name) for name in POKEDEX_ORDER_ARRAYS}
+_cached_array_re = functools.lru_cache(maxsize=64)(_compile_array_re)
+
+
+def _array_re(name: str) -> "re.Pattern[str]":
+    pattern = _KNOWN_ARRAY_RES.get(name)
+    if pattern is None:
+        pattern = _cached_array_re(name)
+    return pattern
 
 
-def write_json(path: Path, payload: object) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
-        handle.write("\n")
+@functools.lru_cache(maxsize=64)
+def _family_block_re(macro: str) -> "re.Pattern[str]":
+    return re.compile(FAMILY_BLOCK_TEMPLATE.format(macro=re.escape(macro)), re.DOTALL)
 
 
-def copy_asset(source: Path, destination: Path) -> None:
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(source, destination)
+@functools.lru_cache(maxsize=64)
+def _family_toggle_re(macro: str) -> "re.Pattern[str]":
+    return re.compile(FAMILY_TOGGLE_TEMPLATE.format(macro=re.escape(macro)))
+
+
+def write_json(path: Path, payload: object, *, make_parents: bool = True) -> None:
+    if make_parents:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    data = json.dumps(payload, indent=2) + "\n"
+    path.write_bytes(data.encode("utf-8"))
+
+
+def copy_asset(source: Path, destination: Path, *, make_parents: bool = True) -> None:
+    if make_parents:
+        destination.parent.mkdir(parents=True, exist_ok=True)
+    if destination.exists() and os.path.samefile(source, destination):
+        raise shutil.SameFileError(f"{source!r} and {destination!r} are the same file")
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is not None:
+        try:
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining <= 0:
+                return
+        except OSError:
+            pass
+    shutil.copyfile(source, destination)
 
 
 def apply_graphics(pokemon: PokemonData, assets: AssetBundle) -> None:
@@ -133,17 +182,17 @@ def apply_graphics(pokemon: PokemonData, assets: AssetBundle) -> None:
     validate_png(assets.back, (64, 64))
     validate_png(assets.icon, (32, 32))
 
-    copy_asset(assets.front, graphics_folder / "front.png")
-    copy_asset(assets.back, graphics_folder / "back.png")
-    copy_asset(assets.icon, graphics_folder / "icon.png")
+    copy_asset(assets.front, graphics_folder / "front.png", make_parents=False)
+    copy_asset(assets.back, graphics_folder / "back.png", make_parents=False)
+    copy_asset(assets.icon, graphics_folder / "icon.png", make_parents=False)
 
     validate_palette(assets.normal_palette)
     normal_dest = graphics_folder / "normal.pal"
-    copy_asset(assets.normal_palette, normal_dest)
+    copy_asset(assets.normal_palette, normal_dest, make_parents=False)
     shiny_dest = graphics_folder / "shiny.pal"
     if assets.shiny_palette:
         validate_palette(assets.shiny_palette)
-        copy_asset(assets.shiny_palette, shiny_dest)
+        copy_asset(assets.shiny_palette, shiny_dest, make_parents=False)
     else:
         ensure_shiny_palette(normal_dest, shiny_dest)
 
@@ -157,64 +206,90 @@ def apply_graphics(pokemon: PokemonData, assets: AssetBundle) -> None:
 
 def save_json_payloads(pokemon: PokemonData) -> None:
     species_folder = project_paths.DATA_JSON_ROOT / pokemon.graphics_folder
-    write_json(species_folder / "base_stats.json", pokemon.base_stats_json())
+    learnset_folder = species_folder / "learnsets"
+    learnset_folder.mkdir(parents=True, exist_ok=True)
     learnsets = pokemon.learnsets_json()
-    write_json(species_folder / "learnsets" / "level_up.json", {"entries": learnsets["levelUp"]})
-    write_json(species_folder / "learnsets" / "egg.json", {"moves": learnsets["egg"]})
-    write_json(species_folder / "learnsets" / "tm.json", {"moves": learnsets["tm"]})
-    write_json(species_folder / "evolutions.json", pokemon.evolutions_json())
-    write_json(species_folder / "pokedex.json", pokemon.pokedex_json())
-    write_json(species_folder / "names.json", pokemon.names_json())
-    write_json(species_folder / "dex_order.json", pokemon.dex_order_json())
+    payloads = (
+        (species_folder / "base_stats.json", pokemon.base_stats_json()),
+        (learnset_folder / "level_up.json", {"entries": learnsets["levelUp"]}),
+        (learnset_folder / "egg.json", {"moves": learnsets["egg"]}),
+        (learnset_folder / "tm.json", {"moves": learnsets["tm"]}),
+        (species_folder / "evolutions.json", pokemon.evolutions_json()),
+        (species_folder / "pokedex.json", pokemon.pokedex_json()),
+        (species_folder / "names.json", pokemon.names_json()),
+        (species_folder / "dex_order.json", pokemon.dex_order_json()),
+    )
+    for path, payload in payloads:
+        write_json(path, payload, make_parents=False)
 
 
 def update_family_toggle(family_macro: str) -> bool:
     text = project_paths.SPECIES_ENABLED_PATH.read_text(encoding="utf-8")
-    pattern = rf"(#define\s+{family_macro}\s+)([^/\n]+)"
-    match = re.search(pattern, text)
+    match = _family_toggle_re(family_macro).search(text)
     if not match:
         raise ValueError(f"Could not find {family_macro} in {project_paths.SPECIES_ENABLED_PATH}")
     current = match.group(2).strip()
     if current == "TRUE":
         return False
-    suffix = text[match.end(2):match.end()]
-    text = text[: match.start()] + match.group(1) + "TRUE" + suffix + text[match.end():]
+    text = "".join((text[: match.start(2)], "TRUE", text[match.end(2) :]))
     project_paths.SPECIES_ENABLED_PATH.write_text(text, encoding="utf-8")
     return True
 
 
-def parse_array(path: Path, array_name: str) -> List[str]:
-    pattern = re.compile(ARRAY_RE_TEMPLATE.format(name=array_name), re.DOTALL)
-    text = path.read_text(encoding="utf-8")
-    match = pattern.search(text)
+def _find_array(text: str, path: Path, array_name: str) -> "re.Match[str]":
+    match = _array_re(array_name).search(text)
     if not match:
         raise ValueError(f"Unable to locate array {array_name} in {path}")
+    return match
+
+
+def _array_entries(match: "re.Match[str]") -> List[str]:
     body = match.group("body")
     return [line.strip().rstrip(",") for line in body.splitlines() if line.strip()]
 
 
+def parse_array(path: Path, array_name: str) -> List[str]:
+    text = path.read_text(encoding="utf-8")
+    return _array_entries(_find_array(text, path, array_name))
+
+
 def format_array(entries: Sequence[str]) -> str:
     return "\n".join(f"    {entry}," for entry in entries)
 
 
+def _replace_arrays(text: str, path: Path, updates: Mapping[str, Sequence[str]]) -> str:
+    spans = []
+    for array_name, entries in updates.items():
+        match = _find_array(text, path, array_name)
+        spans.append((match.start("body"), match.end("body"), format_array(entries)))
+    spans.sort()
+    pieces: List[str] = []
+    position = 0
+    for start, end, body in spans:
+        pieces.append(text[position:start])
+        pieces.append(body)
+        position = end
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
 def update_array(path: Path, array_name: str, new_entries: Sequence[str]) -> None:
-    import re
+    update_arrays(path, {array_name: new_entries})
 
-    text = path.read_text(encoding="utf-8")
-    pattern = re.compile(ARRAY_RE_TEMPLATE.format(name=array_name), re.DOTALL)
-    match = pattern.search(text)
-    if not match:
-        raise ValueError(f"Unable to locate array {array_name} in {path}")
-    new_body = format_array(new_entries)
-    text = text[: match.start("body")] + new_body + text[match.end("body") :]
-    path.write_text(text, encoding="utf-8")
 
+def update_arrays(path: Path, updates: Mapping[str, Sequence[str]]) -> None:
+    text = path.read_text(encoding="utf-8")
+    updated = _replace_arrays(text, path, updates)
+    if updated != text:
+        path.write_text(updated, encoding="utf-8")
 
-def update_pokedex_orders(pokemon: PokemonData) -> None:
-    import re
 
-    metadata = load_species_metadata()
-    metadata[pokemon.species_constant] = SpeciesMetadata(
+def update_pokedex_orders(
+    pokemon: PokemonData, metadata: Optional[Mapping[str, SpeciesMetadata]] = None
+) -> None:
+    if metadata is None:
+        metadata = load_species_metadata()
+    current = SpeciesMetadata(
         species_constant=pokemon.species_constant,
         display_name=pokemon.display_name,
         height=pokemon.height,
@@ -222,74 +297,103 @@ def update_pokedex_orders(pokemon: PokemonData) -> None:
     )
 
     path = project_paths.POKEDEX_ORDERS_PATH
-    def species_from_natdex(natdex: str) -> str:
-        return natdex.replace("NATIONAL_DEX_", "SPECIES_")
+    # The three arrays share most entries, so resolve each one's metadata once.
+    resolved: Dict[str, Optional[SpeciesMetadata]] = {}
+
+    def meta_for(entry: str) -> Optional[SpeciesMetadata]:
+        try:
+            return resolved[entry]
+        except KeyError:
+            pass
+        species_key = entry.replace("NATIONAL_DEX_", "SPECIES_")
+        meta = current if species_key == current.species_constant else metadata.get(species_key)
+        resolved[entry] = meta
+        return meta
 
     def alphabetical_key(entry: str) -> Tuple[str, str]:
-        species_key = species_from_natdex(entry)
-        meta = metadata.get(species_key)
+        meta = meta_for(entry)
         name = meta.display_name.lower() if meta else entry.lower()
         return name, entry
 
     def numeric_key(entry: str, attribute: str) -> Tuple[int, str]:
-        species_key = species_from_natdex(entry)
-        meta = metadata.get(species_key)
+        meta = meta_for(entry)
         value = getattr(meta, attribute) if meta else None
         return (value if value is not None else 10 ** 6, entry)
 
     arrays = {
-        "gPokedexOrder_Alphabetical": lambda entry: alphabetical_key(entry),
+        "gPokedexOrder_Alphabetical": alphabetical_key,
         "gPokedexOrder_Height": lambda entry: numeric_key(entry, "height"),
         "gPokedexOrder_Weight": lambda entry: numeric_key(entry, "weight"),
     }
 
+    text = path.read_text(encoding="utf-8")
+    target = pokemon.national_dex_constant
+    updates: Dict[str, List[str]] = {}
     for array_name, key_fn in arrays.items():
-        entries = parse_array(path, array_name)
-        target = pokemon.national_dex_constant
-        if target not in entries:
-            entries.append(target)
-        entries = sorted(set(entries), key=key_fn)
-        update_array(path, array_name, entries)
+        existing = _array_entries(_find_array(text, path, array_name))
+        entries = sorted(set(existing) | {target}, key=key_fn)
+        if entries != existing:
+            updates[array_name] = entries
+    if updates:
+        path.write_text(_replace_arrays(text, path, updates), encoding="utf-8")
 
 
-def insert_cry_line(text: str, start_marker: str, family_macro: str, directive: str, cry_label: str) -> Tuple[str, bool]:
-    import re
-
+def _cry_section(text: str, start_marker: str) -> Tuple[int, int]:
     start_index = text.find(start_marker)
     if start_index == -1:
         raise ValueError(f"Could not locate {start_marker} in cry table")
+    end_index = len(text)
     if start_marker == "gCryTable::":
-        end_marker = "gCryTable_Reverse::"
-        end_index = text.find(end_marker, start_index + len(start_marker))
-        if end_index == -1:
-            end_index = len(text)
-    else:
-        end_index = len(text)
-    section = text[start_index:end_index]
-    block_pattern = re.compile(
-        FAMILY_BLOCK_TEMPLATE.format(macro=family_macro), re.DOTALL
-    )
-    match = block_pattern.search(section)
-    if not match:
-        raise ValueError(f"Unable to find block for {family_macro} in cry table section")
-    body = match.group("body")
-    line = f"        {directive} {cry_label}"
-    if line in body:
+        reverse_index = text.find("gCryTable_Reverse::", start_index + len(start_marker))
+        if reverse_index != -1:
+            end_index = reverse_index
+    return start_index, end_index
+
+
+def _insert_cry_lines(
+    text: str, family_macro: str, entries: Sequence[Tuple[str, str, str]]
+) -> Tuple[str, bool]:
+    """Insert ``(start_marker, directive, cry_label)`` lines with one pass over ``text``."""
+    block_pattern = _family_block_re(family_macro)
+    insertions: List[Tuple[int, str]] = []
+    for start_marker, directive, cry_label in entries:
+        start_index, end_index = _cry_section(text, start_marker)
+        match = block_pattern.search(text, start_index, end_index)
+        if not match:
+            raise ValueError(f"Unable to find block for {family_macro} in cry table section")
+        body = match.group("body")
+        line = f"        {directive} {cry_label}"
+        if line in body:
+            continue
+        newline = "\n" if not body.endswith("\n") else ""
+        insertions.append((match.end("body"), newline + line + "\n"))
+    if not insertions:
         return text, False
-    newline = "\n" if not body.endswith("\n") else ""
-    body_with_entry = body + newline + line + "\n"
-    new_section = section[: match.start("body")] + body_with_entry + section[match.end("body") :]
-    text = text[:start_index] + new_section + text[end_index:]
-    return text, True
+    insertions.sort(key=lambda item: item[0])
+    pieces: List[str] = []
+    position = 0
+    for index, addition in insertions:
+        pieces.append(text[position:index])
+        pieces.append(addition)
+        position = index
+    pieces.append(text[position:])
+    return "".join(pieces), True
+
+
+def insert_cry_line(text: str, start_marker: str, family_macro: str, directive: str, cry_label: str) -> Tuple[str, bool]:
+    return _insert_cry_lines(text, family_macro, [(start_marker, directive, cry_label)])
 
 
 def update_cry_tables(family_macro: str, cry_label: str) -> bool:
     text = project_paths.CRY_TABLE_PATH.read_text(encoding="utf-8")
-    updated = False
-    text, changed_forward = insert_cry_line(text, "gCryTable::", family_macro, "cry", cry_label)
-    updated = updated or changed_forward
-    text, changed_reverse = insert_cry_line(text, "gCryTable_Reverse::", family_macro, "cry_reverse", cry_label)
-    updated = updated or changed_reverse
+    text, updated = _insert_cry_lines(
+        text,
+        family_macro,
+        [
+            ("gCryTable::", "cry", cry_label),
+            ("gCryTable_Reverse::", "cry_reverse", cry_label),
+        ],
+    )
     if updated:
         project_paths.CRY_TABLE_PATH.write_text(text, encoding="utf-8")
     return updated
@@ -9,6 +9,11 @@ try:
 except ImportError:  # pragma: no cover - handled at runtime
     Image = None  # type: ignore
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional speed-up
+    np = None  # type: ignore
+
 
 class PillowUnavailableError(RuntimeError):
     pass
@@ -29,51 +34,60 @@ def validate_png(path: Path, expected_size: Tuple[int, int], max_colors: int = 1
     with Image.open(path) as image:
         if image.size != expected_size:
             raise ValueError(f"{path} must be {expected_size[0]}x{expected_size[1]} pixels; got {image.size}.")
-        colors = image.convert("RGBA").getcolors(maxcolors=max_colors + 1)
-        if colors is None:
+        if _exceeds_colour_limit(image, max_colors):
             raise ValueError(f"{path} uses more than {max_colors} colours.")
 
 
+def _exceeds_colour_limit(image: "Image.Image", max_colors: int) -> bool:
+    # Every path allows up to max_colors + 1 distinct colours, matching getcolors' cutoff.
+    limit = max_colors + 1
+    if image.mode == "P" and image.getcolors(maxcolors=limit) is not None:
+        # Indexed sprites can never show more colours than palette slots used.
+        return False
+    rgba = image.convert("RGBA")
+    if np is None:
+        return rgba.getcolors(maxcolors=limit) is None
+    pixels = np.asarray(rgba, dtype=np.uint8).reshape(-1, 4).view(np.uint32)
+    return len(np.unique(pixels)) > limit
+
+
 def read_jasc_palette(path: Path) -> List[RGBColor]:
-    with path.open("r", encoding="utf-8") as handle:
-        header = handle.readline().strip()
-        if header != "JASC-PAL":
-            raise ValueError(f"{path} is not a JASC-PAL palette.")
-        version = handle.readline().strip()
-        if version != "0100":
-            raise ValueError(f"{path} has unsupported palette version {version!r}.")
-        count_line = handle.readline().strip()
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    lines.extend([""] * (3 - len(lines)))
+    header = lines[0].strip()
+    if header != "JASC-PAL":
+        raise ValueError(f"{path} is not a JASC-PAL palette.")
+    version = lines[1].strip()
+    if version != "0100":
+        raise ValueError(f"{path} has unsupported palette version {version!r}.")
+    count_line = lines[2].strip()
+    try:
+        count = int(count_line)
+    except ValueError as exc:
+        raise ValueError(f"{path} has invalid colour count {count_line!r}.") from exc
+    if count != 16:
+        raise ValueError(f"{path} must contain exactly 16 colours (found {count}).")
+    entries = lines[3 : 3 + count]
+    colours: List[RGBColor] = []
+    for line in entries:
+        parts = line.split()
+        if len(parts) != 3:
+            raise ValueError(f"{path} has malformed colour entry {line!r}.")
         try:
-            count = int(count_line)
+            r, g, b = int(parts[0]), int(parts[1]), int(parts[2])
         except ValueError as exc:
-            raise ValueError(f"{path} has invalid colour count {count_line!r}.") from exc
-        if count != 16:
-            raise ValueError(f"{path} must contain exactly 16 colours (found {count}).")
-        colours: List[RGBColor] = []
-        for _ in range(count):
-            line = handle.readline()
-            if not line:
-                raise ValueError(f"{path} ended before all palette entries were read.")
-            parts = line.strip().split()
-            if len(parts) != 3:
-                raise ValueError(f"{path} has malformed colour entry {line!r}.")
-            try:
-                r, g, b = map(int, parts)
-            except ValueError as exc:
-                raise ValueError(f"{path} has a non-integer colour component in {line!r}.") from exc
-            if not all(0 <= value <= 255 for value in (r, g, b)):
-                raise ValueError(f"{path} has colour values outside the 0-255 range in {line!r}.")
-            colours.append((r, g, b))
+            raise ValueError(f"{path} has a non-integer colour component in {line!r}.") from exc
+        if (r | g | b) & ~0xFF:
+            raise ValueError(f"{path} has colour values outside the 0-255 range in {line!r}.")
+        colours.append((r, g, b))
+    if len(colours) != count:
+        raise ValueError(f"{path} ended before all palette entries were read.")
     return colours
 
 
 def write_jasc_palette(path: Path, colours: Sequence[RGBColor]) -> None:
-    with path.open("w", encoding="utf-8") as handle:
-        handle.write("JASC-PAL\n")
-        handle.write("0100\n")
-        handle.write(f"{len(colours)}\n")
-        for r, g, b in colours:
-            handle.write(f"{r} {g} {b}\n")
+    body = "".join(f"{r} {g} {b}\n" for r, g, b in colours)
+    path.write_text(f"JASC-PAL\n0100\n{len(colours)}\n{body}", encoding="utf-8")
 
 
 def validate_palette(path: Path) -> List[RGBColor]:
@@ -86,17 +100,16 @@ def validate_palette(path: Path) -> List[RGBColor]:
 def auto_generate_shiny_palette(normal_palette: Sequence[RGBColor]) -> List[RGBColor]:
     if not normal_palette:
         raise ValueError("Normal palette is empty; cannot create shiny palette.")
-    first_colour = normal_palette[0]
-    rest = list(normal_palette[1:])
-    if rest:
-        rest = rest[1:] + rest[:1]
-    return [first_colour, *rest]
+    if len(normal_palette) < 2:
+        return list(normal_palette)
+    # Keep the transparent colour and rotate the rest left by one.
+    return [normal_palette[0], *normal_palette[2:], normal_palette[1]]
 
 
 def ensure_shiny_palette(normal_path: Path, shiny_path: Path) -> None:
-    colours = validate_palette(normal_path)
     if shiny_path.exists():
         validate_palette(shiny_path)
         return
+    colours = validate_palette(normal_path)
     shiny_colours = auto_generate_shiny_palette(colours)
     write_jasc_palette(shiny_path, shiny_colours)
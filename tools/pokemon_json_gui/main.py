@@ -1,19 +1,36 @@
 from __future__ import annotations
 
 import argparse
+import bisect
+import functools
+import itertools
 import json
+import queue
 import sys
+import threading
 import traceback
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Set, Tuple
+from typing import AbstractSet, Any, Callable, Dict, List, Optional, Sequence, Tuple
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None  # type: ignore
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
 if __package__:
     from . import project_paths
     from .audio_utils import load_available_cries
     from .constants_loader import (
+        clear_constant_caches,
+        constant_cache_generation,
         ensure_constant_exists,
         load_ability_constants,
         load_egg_groups,
@@ -29,7 +46,8 @@ if __package__:
         normalize_natdex_constant,
         normalize_species_constant,
         showdown_folder_from_species,
-        load_species_family_mapping,
+        load_species_project_records,
+        project_headers_key,
     )
     from .data_models import EvolutionEntry, LearnsetEntry, PokemonData
     from .database import PokemonDatabase, PokemonRecord
@@ -54,6 +72,8 @@ else:  # pragma: no cover - executed when run as a script
     import project_paths  # type: ignore
     from audio_utils import load_available_cries  # type: ignore
     from constants_loader import (  # type: ignore
+        clear_constant_caches,
+        constant_cache_generation,
         ensure_constant_exists,
         load_ability_constants,
         load_egg_groups,
@@ -69,7 +89,8 @@ else:  # pragma: no cover - executed when run as a script
         normalize_natdex_constant,
         normalize_species_constant,
         showdown_folder_from_species,
-        load_species_family_mapping,
+        load_species_project_records,
+        project_headers_key,
     )
     from data_models import EvolutionEntry, LearnsetEntry, PokemonData  # type: ignore
     from database import PokemonDatabase, PokemonRecord  # type: ignore
@@ -124,17 +145,42 @@ def generate_pokemon_assets(
     if assets.cry_sample:
         log("Copying cry sample…")
         copy_cry_sample(assets.cry_sample, data.cry)
+    # The cry table and family toggles were rewritten on disk.
+    clear_constant_caches()
     log("Generation complete.")
 
 
+STAT_NAMES = ("HP", "Attack", "Defense", "SpAttack", "SpDefense", "Speed")
+
+HEADLESS_CONFIG_KEYS = frozenset({"pokemon", "assets", "summary_output"})
+
+
+def _load_headless_config(config_path: Path) -> Dict[str, Any]:
+    # Only the C backend of ijson beats json.load; the pure-Python one is slower.
+    if ijson is not None and getattr(ijson, "backend", "") == "yajl2_c":
+        with config_path.open("rb") as handle:
+            return {
+                key: value
+                for key, value in ijson.kvitems(handle, "", use_float=True)
+                if key in HEADLESS_CONFIG_KEYS
+            }
+    with config_path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _summary_bytes(summary: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(summary, indent=2) + "\n").encode("utf-8")
+
+
 def run_headless(
     config_path: Path,
     summary_output: Optional[Path],
     database_path: Optional[Path],
     store_in_database: bool,
 ) -> None:
-    with config_path.open("r", encoding="utf-8") as handle:
-        payload = json.load(handle)
+    payload = _load_headless_config(config_path)
 
     pokemon_payload = payload.get("pokemon")
     if pokemon_payload is None:
@@ -161,33 +207,103 @@ def run_headless(
 
     if summary_path is not None:
         summary_path.parent.mkdir(parents=True, exist_ok=True)
-        summary_content = json.dumps(pokemon.to_summary(), indent=2)
-        summary_path.write_text(summary_content + "\n", encoding="utf-8")
+        summary_path.write_bytes(_summary_bytes(pokemon.to_summary()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_move(move: str) -> str:
+    return sys.intern(move if move.startswith("MOVE_") else f"MOVE_{move.upper()}")
+
+
+def _learnset_sort_key(entry: LearnsetEntry) -> Tuple[int, str]:
+    return entry.level, entry.move
+
+
+def _learnset_display(entry: LearnsetEntry) -> str:
+    return f"Lv {entry.level}: {entry.move}"
+
+
+def _evolution_display(evo: EvolutionEntry) -> str:
+    display = f"{evo.from_species} -> {evo.target_species} ({evo.method} {evo.parameter})"
+    if evo.conditions:
+        display += f" [{', '.join(evo.conditions)}]"
+    return display
 
 
 @dataclass
 class LearnsetState:
     entries: List[LearnsetEntry]
-
-    def add(self, entry: LearnsetEntry) -> None:
-        self.entries.append(entry)
-        self.entries.sort(key=lambda value: (value.level, value.move))
+    # Loaded learnsets keep their file order until the first add sorts them.
+    _sorted: bool = field(default=False, init=False, repr=False)
+
+    def add(self, entry: LearnsetEntry) -> Optional[int]:
+        """Insert in sorted order; returns the new index, or None if every entry moved."""
+        reordered = not self._sorted
+        if reordered:
+            self.entries.sort(key=_learnset_sort_key)
+            self._sorted = True
+        index = bisect.bisect_right(self.entries, _learnset_sort_key(entry), key=_learnset_sort_key)
+        self.entries.insert(index, entry)
+        return None if reordered else index
 
     def remove(self, index: int) -> None:
         if 0 <= index < len(self.entries):
             self.entries.pop(index)
 
     def as_display(self) -> List[str]:
-        return [f"Lv {entry.level}: {entry.move}" for entry in self.entries]
+        return [_learnset_display(entry) for entry in self.entries]
+
+
+class FilteredCombobox(ttk.Combobox):
+    """Combobox whose dropdown lists the first matches for text typed since the last pick.
+
+    Opening it from a committed value (or an empty field) shows every choice for browsing.
+    """
+
+    MAX_SHOWN = 50
+    EDIT_KEYSYMS = frozenset({"BackSpace", "Delete"})
+
+    def __init__(self, master: tk.Widget, **kwargs: Any) -> None:
+        super().__init__(master, postcommand=self._filter_values, **kwargs)
+        self._choices: Sequence[str] = ()
+        # Text as of the last edit keystroke; None once a value is picked or set elsewhere.
+        self._typed_text: Optional[str] = None
+        self.bind("<KeyRelease>", self._on_key_release, add="+")
+        self.bind("<<ComboboxSelected>>", self._on_selected, add="+")
+
+    def set_choices(self, choices: Sequence[str]) -> None:
+        self._choices = choices
+        self._filter_values()
+
+    def _on_key_release(self, event: tk.Event) -> None:
+        if (event.char and event.char.isprintable()) or event.keysym in self.EDIT_KEYSYMS:
+            self._typed_text = self.get()
+
+    def _on_selected(self, _event: tk.Event) -> None:
+        self._typed_text = None
+
+    def _filter_values(self) -> None:
+        text = self.get()
+        # A value loaded through the textvariable no longer matches what was typed.
+        needle = text.strip().upper() if text == self._typed_text else ""
+        if not needle:
+            self.configure(values=tuple(self._choices))
+            return
+        matches = (choice for choice in self._choices if needle in choice.upper())
+        self.configure(values=tuple(itertools.islice(matches, self.MAX_SHOWN)))
 
 
 class DatabaseBrowser(tk.Toplevel):
+    # Only the visible rows plus this many extra are materialized in the Treeview.
+    WINDOW_MARGIN = 20
+    ROW_HEIGHT = 20
+
     def __init__(
         self,
         master: tk.Widget,
         database: PokemonDatabase,
         load_callback: Callable[[str], None],
-        apply_callback: Callable[[str], None],
+        apply_callback: Callable[[str, Callable[[], None]], None],
     ) -> None:
         super().__init__(master)
         self.database = database
@@ -197,25 +313,58 @@ class DatabaseBrowser(tk.Toplevel):
         self.geometry("560x380")
         self.transient(master)
         self.columnconfigure(0, weight=1)
-        self.rowconfigure(0, weight=1)
+        self.rowconfigure(1, weight=1)
         self._record_sources: Dict[str, str] = {}
+        self._all_records: List[PokemonRecord] = []
+        # _shown_records is _all_records narrowed by the filter box.
+        self._shown_records: List[PokemonRecord] = []
+        self._record_index: Dict[str, int] = {}
+        self._filter_after_id: Optional[str] = None
+        self._top = 0
+        self._selected: Optional[str] = None
+        self._applying = False
+        self._records_token: Optional[Tuple[Any, ...]] = None
+        self._refresh_generation = 0
+        self._refresh_polling = False
+        self._refresh_results: "queue.Queue[Tuple[int, Any, Optional[Exception]]]" = queue.Queue()
 
         columns = ("species", "display", "updated")
-        self.tree = ttk.Treeview(self, columns=columns, show="headings", selectmode="browse")
+        filter_frame = ttk.Frame(self, padding=(0, 0, 0, 8))
+        filter_frame.grid(row=0, column=0, columnspan=5, sticky="ew")
+        filter_frame.columnconfigure(1, weight=1)
+        ttk.Label(filter_frame, text="Filter").grid(row=0, column=0, sticky="w")
+        self.filter_var = tk.StringVar()
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_var)
+        filter_entry.grid(row=0, column=1, sticky="ew", padx=(8, 0))
+        filter_entry.bind("<KeyRelease>", self._on_filter_key)
+
+        style = ttk.Style(self)
+        style.configure("Browser.Treeview", rowheight=self.ROW_HEIGHT)
+        self.tree = ttk.Treeview(
+            self, columns=columns, show="headings", selectmode="browse", style="Browser.Treeview"
+        )
         self.tree.heading("species", text="Species")
         self.tree.heading("display", text="Display Name")
         self.tree.heading("updated", text="Updated")
         self.tree.column("species", width=160, anchor="w")
         self.tree.column("display", width=200, anchor="w")
         self.tree.column("updated", width=160, anchor="w")
-        self.tree.grid(row=0, column=0, columnspan=4, sticky="nsew")
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
-        scrollbar.grid(row=0, column=4, sticky="ns")
-        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.grid(row=1, column=0, columnspan=4, sticky="nsew")
+        # The scrollbar tracks the full record list, not the rows in the Treeview.
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self._on_scroll)
+        self.scrollbar.grid(row=1, column=4, sticky="ns")
         self.tree.bind("<Double-1>", self._on_double_click)
+        self.tree.bind("<Configure>", lambda _event: self._render_window())
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda _event: self._scroll_rows(-3))
+        self.tree.bind("<Button-5>", lambda _event: self._scroll_rows(3))
+        for key, step in (("<Up>", -1), ("<Down>", 1), ("<Home>", -(1 << 30)), ("<End>", 1 << 30)):
+            self.tree.bind(key, lambda _event, step=step: self._move_selection(step))
+        self.tree.bind("<Prior>", lambda _event: self._move_selection(-self._visible_rows()))
+        self.tree.bind("<Next>", lambda _event: self._move_selection(self._visible_rows()))
 
         button_frame = ttk.Frame(self, padding=(0, 8, 0, 0))
-        button_frame.grid(row=1, column=0, columnspan=5, sticky="ew")
+        button_frame.grid(row=2, column=0, columnspan=5, sticky="ew")
         button_frame.columnconfigure(0, weight=1)
         ttk.Button(button_frame, text="Refresh", command=self.refresh).grid(row=0, column=0, sticky="w")
         self.load_button = ttk.Button(button_frame, text="Load into Form", command=self._load_selected)
@@ -225,91 +374,212 @@ class DatabaseBrowser(tk.Toplevel):
         ttk.Button(button_frame, text="Close", command=self.destroy).grid(row=0, column=3, sticky="e", padx=(8, 0))
 
         self.grab_set()
-        self.tree.bind("<<TreeviewSelect>>", self._update_button_states)
+        self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
         self.refresh()
 
     # ------------------------------------------------------------------
     def refresh(self) -> None:
-        self._record_sources.clear()
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        enabled_families = set(load_enabled_family_macros())
-        valid_species = set(load_species_constants().keys())
-        records = self.database.list_entries(
-            enabled_families=enabled_families,
-            valid_species=valid_species,
-        )
-        for record in records:
-            self.tree.insert(
-                "",
-                tk.END,
-                values=(record.species_constant, record.display_name, record.updated_at),
+        # Nothing to re-query when neither the database, the cached project
+        # constants, nor the family/species headers changed since the last gather.
+        token = (self.database.revision(), constant_cache_generation(), project_headers_key())
+        if token == self._records_token:
+            self._apply_filter()
+            return
+        # Gather on a worker thread so large projects do not freeze the window;
+        # only the newest refresh is applied if several overlap.
+        self._refresh_generation += 1
+        generation = self._refresh_generation
+        threading.Thread(target=self._gather_records, args=(generation, token), daemon=True).start()
+        if not self._refresh_polling:
+            self._refresh_polling = True
+            self.after(50, self._poll_records)
+
+    def _gather_records(self, generation: int, token: Tuple[Any, ...]) -> None:
+        try:
+            enabled_families = set(load_enabled_family_macros())
+            # The loaders are cached; a keys view avoids copying the constants per refresh.
+            valid_species = load_species_constants().keys()
+            records = self.database.list_entries(
+                enabled_families=enabled_families,
+                valid_species=valid_species,
             )
-            self._record_sources[record.species_constant] = "database"
+            project_records = self._project_records(enabled_families, valid_species)
+        except Exception as error:  # pragma: no cover - reported on the Tk thread
+            self._refresh_results.put((generation, None, error))
+        else:
+            self._refresh_results.put((generation, (token, records, project_records), None))
+
+    def _poll_records(self) -> None:
+        if not self.winfo_exists():
+            return
+        latest = None
+        while True:
+            try:
+                result = self._refresh_results.get_nowait()
+            except queue.Empty:
+                break
+            if result[0] == self._refresh_generation:
+                latest = result
+        if latest is None:
+            self.after(50, self._poll_records)
+            return
+        self._refresh_polling = False
+        _generation, payload, error = latest
+        if error is not None:
+            messagebox.showerror("Database", f"Unable to list stored Pokémon: {error}", parent=self)
+            return
+        token, records, project_records = payload
+        self._records_token = token
+        self._apply_records(records, project_records)
 
-        project_records = self._project_records(enabled_families, valid_species)
+    def _apply_records(
+        self,
+        records: List[PokemonRecord],
+        project_records: List[PokemonRecord],
+    ) -> None:
+        sources: Dict[str, str] = {record.species_constant: "database" for record in records}
+        rows = list(records)
         for record in project_records:
-            if record.species_constant in self._record_sources:
-                continue
-            self.tree.insert(
+            if record.species_constant not in sources:
+                sources[record.species_constant] = "project"
+                rows.append(record)
+        self._record_sources = sources
+
+        self._all_records = rows
+        self._apply_filter()
+
+    # ------------------------------------------------------------------
+    def _on_filter_key(self, _event: Optional[tk.Event] = None) -> None:
+        # Coalesce fast typing into at most one re-filter per 100 ms.
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(100, self._apply_filter)
+
+    def _apply_filter(self) -> None:
+        self._filter_after_id = None
+        needle = self.filter_var.get().strip().lower()
+        if needle:
+            shown = [
+                record
+                for record in self._all_records
+                if needle in record.species_constant.lower() or needle in record.display_name.lower()
+            ]
+        else:
+            shown = self._all_records
+        self._shown_records = shown
+        self._record_index = {record.species_constant: index for index, record in enumerate(shown)}
+        if self._selected not in self._record_index:
+            self._selected = shown[0].species_constant if shown else None
+        # Keep a surviving selection in view; _render_window clamps the offset.
+        self._top = self._record_index.get(self._selected or "", 0)
+        self._render_window()
+        self._update_button_states()
+
+    # ------------------------------------------------------------------
+    def _visible_rows(self) -> int:
+        height = self.tree.winfo_height()
+        if height <= 1:
+            return int(self.tree.cget("height"))
+        # One row's worth of space goes to the heading.
+        return max(1, height // self.ROW_HEIGHT - 1)
+
+    def _render_window(self) -> None:
+        total = len(self._shown_records)
+        visible = self._visible_rows()
+        self._top = max(0, min(self._top, total - visible))
+        end = min(total, self._top + visible + self.WINDOW_MARGIN)
+
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        # Species constants are unique, so they double as item ids.
+        insert = self.tree.insert
+        for record in self._shown_records[self._top : end]:
+            insert(
                 "",
                 tk.END,
+                iid=record.species_constant,
                 values=(record.species_constant, record.display_name, record.updated_at),
             )
-            self._record_sources[record.species_constant] = "project"
-        if records:
-            first = self.tree.get_children()[0]
-            self.tree.selection_set(first)
-        elif project_records:
-            first = self.tree.get_children()[0]
-            self.tree.selection_set(first)
+        if self._selected is not None and self.tree.exists(self._selected):
+            self.tree.selection_set(self._selected)
+            self.tree.focus(self._selected)
+        if total:
+            self.scrollbar.set(self._top / total, min(total, self._top + visible) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    def _scroll_rows(self, rows: int) -> str:
+        self._top += rows
+        self._render_window()
+        return "break"
+
+    def _on_scroll(self, action: str, amount: str, unit: Optional[str] = None) -> None:
+        if action == "moveto":
+            self._top = int(float(amount) * len(self._shown_records))
+            self._render_window()
+        elif action == "scroll":
+            step = self._visible_rows() if unit == "pages" else 1
+            self._scroll_rows(int(amount) * step)
+
+    def _on_mousewheel(self, event: tk.Event) -> str:
+        delta = event.delta
+        if abs(delta) >= 120:
+            delta //= 120
+        return self._scroll_rows(-3 if delta > 0 else 3)
+
+    def _move_selection(self, step: int) -> str:
+        if not self._shown_records:
+            return "break"
+        current = self._record_index.get(self._selected or "", 0)
+        index = max(0, min(len(self._shown_records) - 1, current + step))
+        self._selected = self._shown_records[index].species_constant
+        visible = self._visible_rows()
+        if index < self._top:
+            self._top = index
+        elif index >= self._top + visible:
+            self._top = index - visible + 1
+        self._render_window()
+        self._update_button_states()
+        return "break"
+
+    def _on_tree_select(self, _event: Optional[tk.Event] = None) -> None:
+        # Rows leaving the window drop out of the Treeview selection; keep our own.
+        selection = self.tree.selection()
+        if selection:
+            self._selected = selection[0]
         self._update_button_states()
 
     # ------------------------------------------------------------------
     def _project_records(
         self,
-        enabled_families: Set[str],
-        valid_species: Set[str],
+        enabled_families: AbstractSet[str],
+        valid_species: AbstractSet[str],
     ) -> List[PokemonRecord]:
-        metadata = load_species_metadata()
-        family_mapping = load_species_family_mapping()
-        records: List[PokemonRecord] = []
-        for species, family in family_mapping.items():
-            if species not in valid_species:
-                continue
-            if family not in enabled_families:
-                continue
-            meta = metadata.get(species)
-            display = meta.display_name if meta else species
-            records.append(
-                PokemonRecord(
-                    species_constant=species,
-                    display_name=display,
-                    updated_at="Project Files",
-                    family_macro=family,
-                )
+        records = [
+            PokemonRecord(
+                species_constant=species,
+                display_name=display,
+                updated_at="Project Files",
+                family_macro=family,
             )
-        records.sort(key=lambda record: (record.display_name, record.species_constant))
+            for species, display, family in load_species_project_records()
+            if species in valid_species and family in enabled_families
+        ]
+        # The loader keeps these sorted, and filtering preserves the order.
         return records
 
     # ------------------------------------------------------------------
     def _selected_species(self) -> Optional[str]:
-        selection = self.tree.selection()
-        if not selection:
-            return None
-        values = self.tree.item(selection[0], "values")
-        return values[0] if values else None
+        return self._selected
 
     # ------------------------------------------------------------------
     def _update_button_states(self, _event: Optional[tk.Event] = None) -> None:
         species = self._selected_species()
         is_database_entry = species is not None and self._record_sources.get(species) == "database"
-        if is_database_entry:
-            self.load_button.state(["!disabled"])
-            self.apply_button.state(["!disabled"])
-        else:
-            self.load_button.state(["disabled"])
-            self.apply_button.state(["disabled"])
+        self.load_button.state(["!disabled"] if is_database_entry else ["disabled"])
+        can_apply = is_database_entry and not self._applying
+        self.apply_button.state(["!disabled"] if can_apply else ["disabled"])
 
     # ------------------------------------------------------------------
     def _load_selected(self) -> None:
@@ -341,17 +611,28 @@ class DatabaseBrowser(tk.Toplevel):
                 "This Pokémon is already part of the project files and does not have a saved database entry.",
             )
             return
+        self._applying = True
+        self._update_button_states()
         try:
-            self.apply_callback(species)
+            self.apply_callback(species, self._on_apply_finished)
         except Exception as error:  # pragma: no cover - defensive UI handling
+            self._on_apply_finished()
             messagebox.showerror("Apply failed", str(error))
 
+    def _on_apply_finished(self) -> None:
+        self._applying = False
+        if self.winfo_exists():
+            self._update_button_states()
+
     # ------------------------------------------------------------------
     def _on_double_click(self, _event=None) -> None:
         self._load_selected()
 
 
 class PokemonApp(tk.Tk):
+    # Older log lines are trimmed so appends stay cheap over a long session.
+    MAX_LOG_LINES = 2000
+
     def __init__(self, database_path: Optional[Path] = None) -> None:
         super().__init__()
         self.title("Pokémon JSON Generator")
@@ -364,7 +645,16 @@ class PokemonApp(tk.Tk):
             self.database = None
             self._database_error = error
         self._database_browser: Optional["DatabaseBrowser"] = None
-        self._load_constants()
+        # Tab path -> (fetch, apply); fetch runs on a worker thread, apply on the Tk thread.
+        self._tab_loaders: Dict[str, Tuple[Callable[[], Any], Callable[[Any], None]]] = {}
+        self._tab_loading_labels: Dict[str, ttk.Label] = {}
+        self._tab_results: "queue.Queue[Tuple[str, Any, Optional[BaseException]]]" = queue.Queue()
+        self._species_after_id: Optional[str] = None
+        self._pending_log: List[str] = []
+        self._generating = False
+        # Last description read from the Text widget; re-read only after an edit.
+        self._description_cache = ""
+        self._description_dirty = True
         self._build_ui()
         if self.database is None and self._database_error is not None:
             self.after(
@@ -378,18 +668,136 @@ class PokemonApp(tk.Tk):
     # ------------------------------------------------------------------
     # constant loading
     # ------------------------------------------------------------------
-    def _load_constants(self) -> None:
-        self.species_constants = load_species_constants()
-        self.natdex_constants = load_national_dex_constants()
-        self.move_constants = sorted(load_move_constants().keys())
-        self.ability_constants = sorted(load_ability_constants().keys())
-        self.type_constants = sorted(load_type_constants().keys())
-        self.growth_rates = sorted(load_growth_rates())
-        self.egg_groups = sorted(load_egg_groups())
-        self.family_macros = sorted(load_family_macros())
-        self.evolution_methods = sorted(load_evolution_methods())
-        self.cries = load_available_cries()
-        self.species_metadata = load_species_metadata()
+    @functools.cached_property
+    def species_constants(self) -> Dict[str, str]:
+        return load_species_constants()
+
+    @functools.cached_property
+    def natdex_constants(self) -> Dict[str, str]:
+        return load_national_dex_constants()
+
+    @functools.cached_property
+    def move_constants(self) -> List[str]:
+        return sorted(load_move_constants().keys())
+
+    @functools.cached_property
+    def ability_constants(self) -> List[str]:
+        return sorted(load_ability_constants().keys())
+
+    @functools.cached_property
+    def type_constants(self) -> List[str]:
+        return sorted(load_type_constants().keys())
+
+    @functools.cached_property
+    def growth_rates(self) -> List[str]:
+        return sorted(load_growth_rates())
+
+    @functools.cached_property
+    def egg_groups(self) -> List[str]:
+        return sorted(load_egg_groups())
+
+    @functools.cached_property
+    def family_macros(self) -> List[str]:
+        return sorted(load_family_macros())
+
+    @functools.cached_property
+    def evolution_methods(self) -> List[str]:
+        return sorted(load_evolution_methods())
+
+    @functools.cached_property
+    def cries(self) -> List[str]:
+        return load_available_cries()
+
+    @functools.cached_property
+    def species_metadata(self) -> Dict[str, Any]:
+        return load_species_metadata()
+
+    # Combobox value lists, built once and shared by every widget that offers them.
+    @functools.cached_property
+    def species_values(self) -> Tuple[str, ...]:
+        return tuple(map(sys.intern, sorted(self.species_constants)))
+
+    @functools.cached_property
+    def move_values(self) -> Tuple[str, ...]:
+        # Interned so moves added from the pickers share these objects and compare by identity.
+        return tuple(map(sys.intern, self.move_constants))
+
+    @functools.cached_property
+    def natdex_values(self) -> Tuple[str, ...]:
+        return tuple(map(sys.intern, sorted(self.natdex_constants)))
+
+    @functools.cached_property
+    def type_values(self) -> Tuple[str, ...]:
+        extra = () if "TYPE_NONE" in self.type_constants else ("TYPE_NONE",)
+        return (*self.type_constants, *extra)
+
+    @functools.cached_property
+    def ability_values(self) -> Tuple[str, ...]:
+        extra = () if "ABILITY_NONE" in self.ability_constants else ("ABILITY_NONE",)
+        return (*extra, *self.ability_constants)
+
+    @functools.cached_property
+    def egg_group_values(self) -> Tuple[str, ...]:
+        extra = () if "EGG_GROUP_NONE" in self.egg_groups else ("EGG_GROUP_NONE",)
+        return (*self.egg_groups, *extra)
+
+    # ------------------------------------------------------------------
+    def _defer_tab_load(
+        self,
+        frame: ttk.Frame,
+        fetch: Callable[[], Any],
+        apply: Callable[[Any], None],
+    ) -> None:
+        self._tab_loaders[str(frame)] = (fetch, apply)
+
+    def _on_tab_changed(self, _event: Optional[tk.Event] = None) -> None:
+        tab = self.notebook.select()
+        if tab not in self._tab_loaders or tab in self._tab_loading_labels:
+            return
+        label = ttk.Label(self.nametowidget(tab), text="Loading…")
+        label.place(relx=1.0, rely=0.0, anchor="ne")
+        self._tab_loading_labels[tab] = label
+        fetch = self._tab_loaders[tab][0]
+
+        def worker() -> None:
+            try:
+                self._tab_results.put((tab, fetch(), None))
+            except BaseException as error:  # pragma: no cover - reported on the Tk thread
+                self._tab_results.put((tab, None, error))
+
+        threading.Thread(target=worker, daemon=True).start()
+        if len(self._tab_loading_labels) == 1:
+            self.after(50, self._poll_tab_loads)
+
+    def _poll_tab_loads(self) -> None:
+        while True:
+            try:
+                tab, result, error = self._tab_results.get_nowait()
+            except queue.Empty:
+                break
+            label = self._tab_loading_labels.pop(tab, None)
+            if label is not None:
+                label.destroy()
+            loader = self._tab_loaders.pop(tab, None)
+            if error is not None:
+                # Leave the tab pending so the next visit or _load_pending_tabs retries it.
+                if loader is not None:
+                    self._tab_loaders[tab] = loader
+                self.log(f"Error loading project constants: {error}")
+            elif loader is not None:
+                loader[1](result)
+        if self._tab_loading_labels:
+            self.after(50, self._poll_tab_loads)
+
+    def _load_pending_tabs(self) -> None:
+        """Finish every deferred tab load synchronously (e.g. before reading the form)."""
+        for tab, (fetch, apply) in list(self._tab_loaders.items()):
+            apply(fetch())
+            # Popped only once applied, so a failing fetch stays pending for a retry.
+            del self._tab_loaders[tab]
+            label = self._tab_loading_labels.pop(tab, None)
+            if label is not None:
+                label.destroy()
 
     # ------------------------------------------------------------------
     def _build_ui(self) -> None:
@@ -398,6 +806,7 @@ class PokemonApp(tk.Tk):
 
         notebook = ttk.Notebook(self)
         notebook.grid(row=0, column=0, sticky="nsew")
+        self.notebook = notebook
 
         self._build_species_tab(notebook)
         self._build_stats_tab(notebook)
@@ -405,6 +814,8 @@ class PokemonApp(tk.Tk):
         self._build_evolutions_tab(notebook)
         self._build_assets_tab(notebook)
         self._build_summary_tab(notebook)
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._on_tab_changed()
 
         footer = ttk.Frame(self)
         footer.grid(row=1, column=0, sticky="ew", padx=8, pady=8)
@@ -413,8 +824,11 @@ class PokemonApp(tk.Tk):
         self.save_button.grid(row=0, column=0, sticky="w")
         self.database_button = ttk.Button(footer, text="Open Database…", command=self.open_database_browser)
         self.database_button.grid(row=0, column=1, sticky="w", padx=(8, 0))
+        self.progress = ttk.Progressbar(footer, mode="indeterminate", length=160)
+        self.progress.grid(row=0, column=2, sticky="e", padx=(0, 8))
+        self.progress.grid_remove()
         self.generate_button = ttk.Button(footer, text="Generate JSON and Assets", command=self.generate)
-        self.generate_button.grid(row=0, column=2, sticky="e")
+        self.generate_button.grid(row=0, column=3, sticky="e")
         if self.database is None:
             self.save_button.state(["disabled"])
             self.database_button.state(["disabled"])
@@ -428,10 +842,11 @@ class PokemonApp(tk.Tk):
         self.category_var.set(data.category_name)
         self.cry_var.set(data.cry)
 
-        for stat, var in self.base_stat_vars.items():
-            var.set(str(data.base_stats.get(stat, 0)))
-        for stat, var in self.ev_vars.items():
-            var.set(str(data.ev_yield.get(stat, 0)))
+        zeros = itertools.repeat(0)
+        for var, value in zip(self._base_stat_var_order, map(data.base_stats.get, STAT_NAMES, zeros)):
+            var.set(str(value))
+        for var, value in zip(self._ev_var_order, map(data.ev_yield.get, STAT_NAMES, zeros)):
+            var.set(str(value))
 
         types = list(data.types)
         self.type1_var.set(types[0] if types else "")
@@ -454,7 +869,9 @@ class PokemonApp(tk.Tk):
         self.friendship_var.set(data.friendship)
         self.icon_palette_var.set(str(data.icon_pal_index) if data.icon_pal_index is not None else "")
 
-        self.level_moves_state.entries = [LearnsetEntry(entry.level, entry.move) for entry in data.learnset_level_up]
+        self.level_moves_state = LearnsetState(
+            entries=[LearnsetEntry(entry.level, entry.move) for entry in data.learnset_level_up]
+        )
         self._refresh_level_moves()
         self.egg_moves = sorted(data.learnset_egg)
         self._refresh_egg_moves()
@@ -479,17 +896,19 @@ class PokemonApp(tk.Tk):
         self.description_text.insert(tk.END, data.description)
 
     # ------------------------------------------------------------------
+    def _asset_var(self, key: str) -> tk.StringVar:
+        var = self.asset_vars.get(key)
+        if var is None:
+            var = self.asset_vars[key] = tk.StringVar()
+        return var
+
     def _populate_assets(self, assets: AssetBundle) -> None:
-        self.asset_vars.setdefault("front", tk.StringVar())
-        self.asset_vars.setdefault("back", tk.StringVar())
-        self.asset_vars.setdefault("icon", tk.StringVar())
-        self.asset_vars.setdefault("normal_palette", tk.StringVar())
-        self.asset_vars["front"].set(str(assets.front))
-        self.asset_vars["back"].set(str(assets.back))
-        self.asset_vars["icon"].set(str(assets.icon))
-        self.asset_vars["normal_palette"].set(str(assets.normal_palette))
+        self._asset_var("front").set(str(assets.front))
+        self._asset_var("back").set(str(assets.back))
+        self._asset_var("icon").set(str(assets.icon))
+        self._asset_var("normal_palette").set(str(assets.normal_palette))
         for _label, (key, _) in OPTIONAL_ASSETS.items():
-            var = self.asset_vars.setdefault(key, tk.StringVar())
+            var = self._asset_var(key)
             if key == "shiny_palette":
                 var.set(str(assets.shiny_palette) if assets.shiny_palette else "")
             elif key == "cry_sample":
@@ -542,15 +961,19 @@ class PokemonApp(tk.Tk):
         messagebox.showinfo("Database", f"{pokemon.display_name} loaded into the editor.")
 
     # ------------------------------------------------------------------
-    def _handle_database_apply(self, species: str) -> None:
+    def _handle_database_apply(self, species: str, on_finished: Callable[[], None]) -> None:
         pokemon, assets = self._load_pokemon_from_database(species)
         self.log(f"Applying {species} from database…")
-        try:
-            generate_pokemon_assets(pokemon, assets, logger=self.log)
-        except Exception as error:
-            self.log(f"Error applying {species}: {error}")
-            raise
-        messagebox.showinfo("Database", f"{pokemon.display_name} applied to the project.")
+
+        def done(error: Optional[BaseException]) -> None:
+            on_finished()
+            if error is not None:
+                self.log(f"Error applying {species}: {error}")
+                messagebox.showerror("Apply failed", str(error))
+            else:
+                messagebox.showinfo("Database", f"{pokemon.display_name} applied to the project.")
+
+        self._run_generation(pokemon, assets, done)
 
     # ------------------------------------------------------------------
     def _load_pokemon_from_database(self, species: str) -> Tuple[PokemonData, AssetBundle]:
@@ -576,16 +999,16 @@ class PokemonApp(tk.Tk):
         self.cry_var = tk.StringVar()
 
         ttk.Label(frame, text="Species constant").grid(row=0, column=0, sticky="w")
-        self.species_combo = ttk.Combobox(frame, textvariable=self.species_var, values=sorted(self.species_constants.keys()))
+        self.species_combo = FilteredCombobox(frame, textvariable=self.species_var)
         self.species_combo.grid(row=0, column=1, sticky="ew")
-        self.species_combo.bind("<<ComboboxSelected>>", self._on_species_selected)
+        self.species_combo.bind("<<ComboboxSelected>>", self._on_species_selected, add="+")
 
         ttk.Label(frame, text="National Dex constant").grid(row=1, column=0, sticky="w", pady=(8, 0))
-        self.natdex_combo = ttk.Combobox(frame, textvariable=self.natdex_var, values=sorted(self.natdex_constants.keys()))
+        self.natdex_combo = FilteredCombobox(frame, textvariable=self.natdex_var)
         self.natdex_combo.grid(row=1, column=1, sticky="ew", pady=(8, 0))
 
         ttk.Label(frame, text="Family macro").grid(row=2, column=0, sticky="w", pady=(8, 0))
-        self.family_combo = ttk.Combobox(frame, textvariable=self.family_macro_var, values=self.family_macros)
+        self.family_combo = ttk.Combobox(frame, textvariable=self.family_macro_var)
         self.family_combo.grid(row=2, column=1, sticky="ew", pady=(8, 0))
 
         ttk.Label(frame, text="Display name").grid(row=3, column=0, sticky="w", pady=(8, 0))
@@ -595,23 +1018,34 @@ class PokemonApp(tk.Tk):
         ttk.Entry(frame, textvariable=self.category_var).grid(row=4, column=1, sticky="ew", pady=(8, 0))
 
         ttk.Label(frame, text="Cry").grid(row=5, column=0, sticky="w", pady=(8, 0))
-        self.cry_combo = ttk.Combobox(frame, textvariable=self.cry_var, values=self.cries)
+        self.cry_combo = ttk.Combobox(frame, textvariable=self.cry_var)
         self.cry_combo.grid(row=5, column=1, sticky="ew", pady=(8, 0))
 
+        def fetch() -> Tuple[Sequence[str], ...]:
+            return self.species_values, self.natdex_values, self.family_macros, self.cries
+
+        def apply(values: Tuple[Sequence[str], ...]) -> None:
+            species, natdex, families, cries = values
+            self.species_combo.set_choices(species)
+            self.natdex_combo.set_choices(natdex)
+            self.family_combo.configure(values=families)
+            self.cry_combo.configure(values=cries)
+
+        self._defer_tab_load(frame, fetch, apply)
+
     # ------------------------------------------------------------------
     def _build_stats_tab(self, notebook: ttk.Notebook) -> None:
         frame = ttk.Frame(notebook, padding=12)
         frame.columnconfigure(2, weight=1)
         notebook.add(frame, text="Stats")
 
-        stat_names = ["HP", "Attack", "Defense", "SpAttack", "SpDefense", "Speed"]
         self.base_stat_vars: Dict[str, tk.StringVar] = {}
         self.ev_vars: Dict[str, tk.StringVar] = {}
 
         ttk.Label(frame, text="Base Stats").grid(row=0, column=0, sticky="w")
         ttk.Label(frame, text="EV Yield").grid(row=0, column=1, sticky="w")
 
-        for idx, stat in enumerate(stat_names, start=1):
+        for idx, stat in enumerate(STAT_NAMES, start=1):
             ttk.Label(frame, text=stat).grid(row=idx, column=0, sticky="w")
             base_var = tk.StringVar(value="0")
             ev_var = tk.StringVar(value="0")
@@ -619,31 +1053,30 @@ class PokemonApp(tk.Tk):
             self.ev_vars[stat] = ev_var
             ttk.Entry(frame, width=8, textvariable=base_var).grid(row=idx, column=0, sticky="e", padx=(80, 0))
             ttk.Entry(frame, width=5, textvariable=ev_var).grid(row=idx, column=1, sticky="w")
+        self._base_stat_var_order = tuple(self.base_stat_vars[stat] for stat in STAT_NAMES)
+        self._ev_var_order = tuple(self.ev_vars[stat] for stat in STAT_NAMES)
 
         ttk.Label(frame, text="Type 1").grid(row=1, column=2, sticky="w")
         ttk.Label(frame, text="Type 2").grid(row=2, column=2, sticky="w")
         self.type1_var = tk.StringVar(value="TYPE_NORMAL")
         self.type2_var = tk.StringVar(value="TYPE_NONE")
-        type_values = sorted(self.type_constants)
-        if "TYPE_NONE" not in type_values:
-            type_values.append("TYPE_NONE")
-        self.type1_combo = ttk.Combobox(frame, textvariable=self.type1_var, values=type_values)
-        self.type2_combo = ttk.Combobox(frame, textvariable=self.type2_var, values=type_values)
+        self.type1_combo = ttk.Combobox(frame, textvariable=self.type1_var)
+        self.type2_combo = ttk.Combobox(frame, textvariable=self.type2_var)
         self.type1_combo.grid(row=1, column=3, sticky="ew")
         self.type2_combo.grid(row=2, column=3, sticky="ew")
 
         ttk.Label(frame, text="Ability 1").grid(row=3, column=2, sticky="w")
         ttk.Label(frame, text="Ability 2").grid(row=4, column=2, sticky="w")
         ttk.Label(frame, text="Hidden Ability").grid(row=5, column=2, sticky="w")
-        ability_values = sorted(self.ability_constants)
-        if "ABILITY_NONE" not in ability_values:
-            ability_values.insert(0, "ABILITY_NONE")
         self.ability1_var = tk.StringVar(value="ABILITY_NONE")
         self.ability2_var = tk.StringVar(value="ABILITY_NONE")
         self.ability3_var = tk.StringVar(value="ABILITY_NONE")
-        ttk.Combobox(frame, textvariable=self.ability1_var, values=ability_values).grid(row=3, column=3, sticky="ew")
-        ttk.Combobox(frame, textvariable=self.ability2_var, values=ability_values).grid(row=4, column=3, sticky="ew")
-        ttk.Combobox(frame, textvariable=self.ability3_var, values=ability_values).grid(row=5, column=3, sticky="ew")
+        ability_combos = [
+            ttk.Combobox(frame, textvariable=var)
+            for var in (self.ability1_var, self.ability2_var, self.ability3_var)
+        ]
+        for row, combo in enumerate(ability_combos, start=3):
+            combo.grid(row=row, column=3, sticky="ew")
 
         ttk.Label(frame, text="Catch Rate").grid(row=6, column=0, sticky="w", pady=(12, 0))
         self.catch_rate_var = tk.StringVar(value="45")
@@ -654,16 +1087,21 @@ class PokemonApp(tk.Tk):
         ttk.Entry(frame, textvariable=self.exp_yield_var).grid(row=7, column=1, sticky="w")
 
         ttk.Label(frame, text="Growth Rate").grid(row=6, column=2, sticky="w", pady=(12, 0))
-        self.growth_var = tk.StringVar(value=self.growth_rates[0] if self.growth_rates else "GROWTH_MEDIUM_FAST")
-        ttk.Combobox(frame, textvariable=self.growth_var, values=self.growth_rates).grid(row=6, column=3, sticky="ew", pady=(12, 0))
+        # Defaults that depend on project constants are filled in once the tab loads.
+        self.growth_var = tk.StringVar()
+        growth_combo = ttk.Combobox(frame, textvariable=self.growth_var)
+        growth_combo.grid(row=6, column=3, sticky="ew", pady=(12, 0))
 
         ttk.Label(frame, text="Egg Group 1").grid(row=7, column=2, sticky="w")
         ttk.Label(frame, text="Egg Group 2").grid(row=8, column=2, sticky="w")
-        self.egg_group1_var = tk.StringVar(value=self.egg_groups[0] if self.egg_groups else "EGG_GROUP_NONE")
+        self.egg_group1_var = tk.StringVar()
         self.egg_group2_var = tk.StringVar(value="EGG_GROUP_NONE")
-        egg_values = self.egg_groups + (["EGG_GROUP_NONE"] if "EGG_GROUP_NONE" not in self.egg_groups else [])
-        ttk.Combobox(frame, textvariable=self.egg_group1_var, values=egg_values).grid(row=7, column=3, sticky="ew")
-        ttk.Combobox(frame, textvariable=self.egg_group2_var, values=egg_values).grid(row=8, column=3, sticky="ew")
+        egg_combos = [
+            ttk.Combobox(frame, textvariable=self.egg_group1_var),
+            ttk.Combobox(frame, textvariable=self.egg_group2_var),
+        ]
+        for row, combo in enumerate(egg_combos, start=7):
+            combo.grid(row=row, column=3, sticky="ew")
 
         ttk.Label(frame, text="Gender Ratio").grid(row=8, column=0, sticky="w", pady=(12, 0))
         self.gender_ratio_var = tk.StringVar(value="PERCENT_FEMALE(50)")
@@ -681,6 +1119,25 @@ class PokemonApp(tk.Tk):
         self.icon_palette_var = tk.StringVar()
         ttk.Entry(frame, textvariable=self.icon_palette_var).grid(row=10, column=3, sticky="ew", pady=(12, 0))
 
+        def fetch() -> Tuple[Sequence[str], ...]:
+            return self.type_values, self.ability_values, self.growth_rates, self.egg_group_values
+
+        def apply(values: Tuple[Sequence[str], ...]) -> None:
+            type_values, ability_values, growth_rates, egg_values = values
+            self.type1_combo.configure(values=type_values)
+            self.type2_combo.configure(values=type_values)
+            for combo in ability_combos:
+                combo.configure(values=ability_values)
+            growth_combo.configure(values=growth_rates)
+            if not self.growth_var.get():
+                self.growth_var.set(growth_rates[0] if growth_rates else "GROWTH_MEDIUM_FAST")
+            for combo in egg_combos:
+                combo.configure(values=egg_values)
+            if not self.egg_group1_var.get():
+                self.egg_group1_var.set(egg_values[0])
+
+        self._defer_tab_load(frame, fetch, apply)
+
     # ------------------------------------------------------------------
     def _build_learnsets_tab(self, notebook: ttk.Notebook) -> None:
         frame = ttk.Frame(notebook, padding=12)
@@ -703,7 +1160,8 @@ class PokemonApp(tk.Tk):
         self.level_move_var = tk.StringVar()
         self.level_level_var = tk.StringVar(value="1")
         ttk.Label(level_frame, text="Move").grid(row=1, column=0, sticky="w", pady=(8, 0))
-        ttk.Combobox(level_frame, textvariable=self.level_move_var, values=self.move_constants).grid(row=1, column=1, sticky="ew", pady=(8, 0))
+        level_move_combo = FilteredCombobox(level_frame, textvariable=self.level_move_var)
+        level_move_combo.grid(row=1, column=1, sticky="ew", pady=(8, 0))
         ttk.Label(level_frame, text="Level").grid(row=1, column=2, sticky="w", pady=(8, 0))
         ttk.Entry(level_frame, textvariable=self.level_level_var, width=5).grid(row=1, column=2, sticky="e", pady=(8, 0))
         ttk.Button(level_frame, text="Add", command=self._add_level_move).grid(row=2, column=1, sticky="e", pady=(8, 0))
@@ -721,7 +1179,8 @@ class PokemonApp(tk.Tk):
         egg_scroll.grid(row=0, column=2, sticky="ns")
         self.egg_listbox.configure(yscrollcommand=egg_scroll.set)
         self.egg_move_var = tk.StringVar()
-        ttk.Combobox(egg_frame, textvariable=self.egg_move_var, values=self.move_constants).grid(row=1, column=0, sticky="ew", pady=(8, 0))
+        egg_move_combo = FilteredCombobox(egg_frame, textvariable=self.egg_move_var)
+        egg_move_combo.grid(row=1, column=0, sticky="ew", pady=(8, 0))
         ttk.Button(egg_frame, text="Add", command=self._add_egg_move).grid(row=1, column=1, sticky="e", pady=(8, 0))
         ttk.Button(egg_frame, text="Remove", command=self._remove_egg_move).grid(row=2, column=1, sticky="e")
 
@@ -736,10 +1195,17 @@ class PokemonApp(tk.Tk):
         tm_scroll.grid(row=0, column=2, sticky="ns")
         self.tm_listbox.configure(yscrollcommand=tm_scroll.set)
         self.tm_move_var = tk.StringVar()
-        ttk.Combobox(tm_frame, textvariable=self.tm_move_var, values=self.move_constants).grid(row=1, column=0, sticky="ew", pady=(8, 0))
+        tm_move_combo = FilteredCombobox(tm_frame, textvariable=self.tm_move_var)
+        tm_move_combo.grid(row=1, column=0, sticky="ew", pady=(8, 0))
         ttk.Button(tm_frame, text="Add", command=self._add_tm_move).grid(row=1, column=1, sticky="e", pady=(8, 0))
         ttk.Button(tm_frame, text="Remove", command=self._remove_tm_move).grid(row=2, column=1, sticky="e")
 
+        def apply(moves: Tuple[str, ...]) -> None:
+            for combo in (level_move_combo, egg_move_combo, tm_move_combo):
+                combo.set_choices(moves)
+
+        self._defer_tab_load(frame, lambda: self.move_values, apply)
+
     # ------------------------------------------------------------------
     def _build_evolutions_tab(self, notebook: ttk.Notebook) -> None:
         frame = ttk.Frame(notebook, padding=12)
@@ -754,22 +1220,24 @@ class PokemonApp(tk.Tk):
         evo_scroll.grid(row=0, column=4, sticky="ns")
         self.evo_listbox.configure(yscrollcommand=evo_scroll.set)
 
-        species_values = sorted(self.species_constants.keys())
         self.evo_from_var = tk.StringVar()
-        self.evo_method_var = tk.StringVar(value=self.evolution_methods[0] if self.evolution_methods else "EVO_LEVEL")
+        self.evo_method_var = tk.StringVar()
         self.evo_param_var = tk.StringVar(value="0")
         self.evo_target_var = tk.StringVar()
         self.evo_conditions_var = tk.StringVar()
 
         ttk.Label(frame, text="From Species").grid(row=1, column=0, sticky="w", pady=(8, 0))
-        ttk.Combobox(frame, textvariable=self.evo_from_var, values=species_values).grid(row=1, column=1, sticky="ew", pady=(8, 0))
+        evo_from_combo = FilteredCombobox(frame, textvariable=self.evo_from_var)
+        evo_from_combo.grid(row=1, column=1, sticky="ew", pady=(8, 0))
         ttk.Label(frame, text="Method").grid(row=1, column=2, sticky="w", pady=(8, 0))
-        ttk.Combobox(frame, textvariable=self.evo_method_var, values=self.evolution_methods).grid(row=1, column=3, sticky="ew", pady=(8, 0))
+        evo_method_combo = ttk.Combobox(frame, textvariable=self.evo_method_var)
+        evo_method_combo.grid(row=1, column=3, sticky="ew", pady=(8, 0))
 
         ttk.Label(frame, text="Parameter").grid(row=2, column=0, sticky="w")
         ttk.Entry(frame, textvariable=self.evo_param_var).grid(row=2, column=1, sticky="ew")
         ttk.Label(frame, text="Target Species").grid(row=2, column=2, sticky="w")
-        ttk.Combobox(frame, textvariable=self.evo_target_var, values=species_values).grid(row=2, column=3, sticky="ew")
+        evo_target_combo = FilteredCombobox(frame, textvariable=self.evo_target_var)
+        evo_target_combo.grid(row=2, column=3, sticky="ew")
 
         ttk.Label(frame, text="Conditions (comma-separated)").grid(row=3, column=0, columnspan=2, sticky="w", pady=(8, 0))
         ttk.Entry(frame, textvariable=self.evo_conditions_var).grid(row=3, column=2, columnspan=2, sticky="ew", pady=(8, 0))
@@ -777,6 +1245,19 @@ class PokemonApp(tk.Tk):
         ttk.Button(frame, text="Add Evolution", command=self._add_evolution).grid(row=4, column=2, sticky="e", pady=(8, 0))
         ttk.Button(frame, text="Remove Selected", command=self._remove_evolution).grid(row=4, column=3, sticky="e", pady=(8, 0))
 
+        def fetch() -> Tuple[Sequence[str], ...]:
+            return self.species_values, self.evolution_methods
+
+        def apply(values: Tuple[Sequence[str], ...]) -> None:
+            species_values, methods = values
+            evo_from_combo.set_choices(species_values)
+            evo_target_combo.set_choices(species_values)
+            evo_method_combo.configure(values=methods)
+            if not self.evo_method_var.get():
+                self.evo_method_var.set(methods[0] if methods else "EVO_LEVEL")
+
+        self._defer_tab_load(frame, fetch, apply)
+
     # ------------------------------------------------------------------
     def _build_assets_tab(self, notebook: ttk.Notebook) -> None:
         frame = ttk.Frame(notebook, padding=12)
@@ -798,6 +1279,7 @@ class PokemonApp(tk.Tk):
         ttk.Label(frame, text="Pokédex description").grid(row=3, column=0, sticky="nw", pady=(8, 0))
         self.description_text = tk.Text(frame, height=8, wrap="word")
         self.description_text.grid(row=3, column=1, sticky="nsew", pady=(8, 0))
+        self.description_text.bind("<<Modified>>", self._on_description_modified)
         frame.rowconfigure(3, weight=1)
 
         self.asset_vars: Dict[str, tk.StringVar] = {}
@@ -817,7 +1299,8 @@ class PokemonApp(tk.Tk):
         self.asset_vars[key] = var
         entry = ttk.Entry(frame, textvariable=var)
         entry.grid(row=row, column=1, sticky="ew")
-        ttk.Button(frame, text="Browse", command=lambda v=var, ft=filetypes: self._browse_for_file(v, ft)).grid(row=row, column=2, padx=(8, 0))
+        dialog_filetypes = (filetypes, ("All files", "*.*"))
+        ttk.Button(frame, text="Browse", command=lambda: self._browse_for_file(var, dialog_filetypes)).grid(row=row, column=2, padx=(8, 0))
 
     # ------------------------------------------------------------------
     def _build_summary_tab(self, notebook: ttk.Notebook) -> None:
@@ -833,13 +1316,38 @@ class PokemonApp(tk.Tk):
         self.log_text.configure(yscrollcommand=scrollbar.set)
 
     # ------------------------------------------------------------------
-    def _browse_for_file(self, var: tk.StringVar, filetypes) -> None:
-        path = filedialog.askopenfilename(filetypes=[filetypes, ("All files", "*.*")])
+    def _browse_for_file(self, var: tk.StringVar, filetypes: Sequence[Tuple[str, str]]) -> None:
+        path = filedialog.askopenfilename(filetypes=filetypes)
         if path:
             var.set(path)
 
+    # ------------------------------------------------------------------
+    def _on_description_modified(self, _event: Optional[tk.Event] = None) -> None:
+        if self.description_text.edit_modified():
+            self._description_dirty = True
+            # Clearing the flag re-arms <<Modified>> for the next edit.
+            self.description_text.edit_modified(False)
+
+    def _description(self) -> str:
+        if self._description_dirty:
+            self._description_cache = self.description_text.get("1.0", "end-1c").strip()
+            self._description_dirty = False
+        return self._description_cache
+
     # ------------------------------------------------------------------
     def _on_species_selected(self, _event=None) -> None:
+        # Arrowing through the dropdown fires per item; only act on where it settles.
+        if self._species_after_id is not None:
+            self.after_cancel(self._species_after_id)
+        self._species_after_id = self.after(150, self._apply_species_selection)
+
+    def _flush_species_selection(self) -> None:
+        if self._species_after_id is not None:
+            self.after_cancel(self._species_after_id)
+            self._apply_species_selection()
+
+    def _apply_species_selection(self) -> None:
+        self._species_after_id = None
         species = normalize_species_constant(self.species_var.get())
         self.species_var.set(species)
         default_folder = showdown_folder_from_species(species)
@@ -863,27 +1371,29 @@ class PokemonApp(tk.Tk):
         if not move or not level_text:
             messagebox.showerror("Level-up Move", "Both move and level are required.")
             return
-        move = move if move.startswith("MOVE_") else f"MOVE_{move.upper()}"
+        move = _normalize_move(move)
         try:
             level = int(level_text)
         except ValueError:
             messagebox.showerror("Level-up Move", "Level must be an integer.")
             return
         entry = LearnsetEntry(level=level, move=move)
-        self.level_moves_state.add(entry)
-        self._refresh_level_moves()
+        index = self.level_moves_state.add(entry)
+        if index is None:
+            self._refresh_level_moves()
+        else:
+            self.level_listbox.insert(index, _learnset_display(entry))
 
     def _remove_level_move(self) -> None:
         selection = self.level_listbox.curselection()
         if not selection:
             return
         self.level_moves_state.remove(selection[0])
-        self._refresh_level_moves()
+        self.level_listbox.delete(selection[0])
 
     def _refresh_level_moves(self) -> None:
         self.level_listbox.delete(0, tk.END)
-        for display in self.level_moves_state.as_display():
-            self.level_listbox.insert(tk.END, display)
+        self.level_listbox.insert(tk.END, *self.level_moves_state.as_display())
 
     # ------------------------------------------------------------------
     def _add_egg_move(self) -> None:
@@ -891,23 +1401,22 @@ class PokemonApp(tk.Tk):
         if not move:
             messagebox.showerror("Egg Move", "Select a move first.")
             return
-        move = move if move.startswith("MOVE_") else f"MOVE_{move.upper()}"
-        if move not in self.egg_moves:
-            self.egg_moves.append(move)
-            self.egg_moves.sort()
-            self._refresh_egg_moves()
+        move = _normalize_move(move)
+        index = bisect.bisect_left(self.egg_moves, move)
+        if index == len(self.egg_moves) or self.egg_moves[index] != move:
+            self.egg_moves.insert(index, move)
+            self.egg_listbox.insert(index, move)
 
     def _remove_egg_move(self) -> None:
         selection = self.egg_listbox.curselection()
         if not selection:
             return
         self.egg_moves.pop(selection[0])
-        self._refresh_egg_moves()
+        self.egg_listbox.delete(selection[0])
 
     def _refresh_egg_moves(self) -> None:
         self.egg_listbox.delete(0, tk.END)
-        for move in self.egg_moves:
-            self.egg_listbox.insert(tk.END, move)
+        self.egg_listbox.insert(tk.END, *self.egg_moves)
 
     # ------------------------------------------------------------------
     def _add_tm_move(self) -> None:
@@ -915,23 +1424,22 @@ class PokemonApp(tk.Tk):
         if not move:
             messagebox.showerror("TM Move", "Select a move first.")
             return
-        move = move if move.startswith("MOVE_") else f"MOVE_{move.upper()}"
-        if move not in self.tm_moves:
-            self.tm_moves.append(move)
-            self.tm_moves.sort()
-            self._refresh_tm_moves()
+        move = _normalize_move(move)
+        index = bisect.bisect_left(self.tm_moves, move)
+        if index == len(self.tm_moves) or self.tm_moves[index] != move:
+            self.tm_moves.insert(index, move)
+            self.tm_listbox.insert(index, move)
 
     def _remove_tm_move(self) -> None:
         selection = self.tm_listbox.curselection()
         if not selection:
             return
         self.tm_moves.pop(selection[0])
-        self._refresh_tm_moves()
+        self.tm_listbox.delete(selection[0])
 
     def _refresh_tm_moves(self) -> None:
         self.tm_listbox.delete(0, tk.END)
-        for move in self.tm_moves:
-            self.tm_listbox.insert(tk.END, move)
+        self.tm_listbox.insert(tk.END, *self.tm_moves)
 
     # ------------------------------------------------------------------
     def _add_evolution(self) -> None:
@@ -952,28 +1460,34 @@ class PokemonApp(tk.Tk):
             conditions=conditions,
         )
         self.evolutions.append(entry)
-        self._refresh_evolutions()
+        self.evo_listbox.insert(tk.END, _evolution_display(entry))
 
     def _remove_evolution(self) -> None:
         selection = self.evo_listbox.curselection()
         if not selection:
             return
         self.evolutions.pop(selection[0])
-        self._refresh_evolutions()
+        self.evo_listbox.delete(selection[0])
 
     def _refresh_evolutions(self) -> None:
         self.evo_listbox.delete(0, tk.END)
-        for evo in self.evolutions:
-            conds = ", ".join(evo.conditions) if evo.conditions else ""
-            display = f"{evo.from_species} -> {evo.target_species} ({evo.method} {evo.parameter})"
-            if conds:
-                display += f" [{conds}]"
-            self.evo_listbox.insert(tk.END, display)
+        self.evo_listbox.insert(tk.END, *map(_evolution_display, self.evolutions))
 
     # ------------------------------------------------------------------
     def log(self, message: str) -> None:
+        # Lines logged in the same event-loop turn are written with one Text insert.
+        if not self._pending_log:
+            self.after_idle(self._flush_log)
+        self._pending_log.append(message)
+
+    def _flush_log(self) -> None:
+        lines, self._pending_log = self._pending_log, []
         self.log_text.configure(state="normal")
-        self.log_text.insert(tk.END, message + "\n")
+        self.log_text.insert(tk.END, "".join(f"{line}\n" for line in lines))
+        # Every logged line ends in a newline, so "end-1c" sits on the empty line after them.
+        excess = int(self.log_text.index("end-1c").split(".")[0]) - 1 - self.MAX_LOG_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
         self.log_text.configure(state="disabled")
         self.log_text.see(tk.END)
 
@@ -983,17 +1497,69 @@ class PokemonApp(tk.Tk):
             data = self._collect_data()
             assets = self._build_asset_bundle()
             self.log("Validating configuration…")
-            self._apply_changes(data, assets)
+            self._run_generation(data, assets, self._on_generate_finished)
+        except Exception as error:  # pragma: no cover - defensive UI handling
+            self._on_generate_finished(error)
+
+    def _on_generate_finished(self, error: Optional[BaseException]) -> None:
+        if error is None:
             messagebox.showinfo("Success", "Pokémon data generated successfully.")
-        except PillowUnavailableError as error:
+        elif isinstance(error, PillowUnavailableError):
             messagebox.showerror("Pillow missing", str(error))
-        except Exception as error:  # pragma: no cover - defensive UI handling
-            traceback.print_exc()
+        else:
+            traceback.print_exception(type(error), error, error.__traceback__)
             messagebox.showerror("Error", str(error))
             self.log(f"Error: {error}")
 
+    # ------------------------------------------------------------------
+    def _run_generation(
+        self,
+        data: PokemonData,
+        assets: AssetBundle,
+        on_done: Callable[[Optional[BaseException]], None],
+    ) -> None:
+        """Run generate_pokemon_assets on a worker thread; on_done runs on the Tk thread."""
+        if self._generating:
+            raise RuntimeError("Another generation is still running.")
+        self._generating = True
+        self.generate_button.state(["disabled"])
+        self.progress.grid()
+        self.progress.start(10)
+        # The worker only touches this queue; the Tk thread drains it.
+        messages: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+
+        def worker() -> None:
+            try:
+                self._apply_changes(data, assets, logger=lambda line: messages.put(("log", line)))
+            except BaseException as error:  # pragma: no cover - reported on the Tk thread
+                messages.put(("done", error))
+            else:
+                messages.put(("done", None))
+
+        def pump() -> None:
+            while True:
+                try:
+                    kind, value = messages.get_nowait()
+                except queue.Empty:
+                    break
+                if kind == "log":
+                    self.log(value)
+                    continue
+                self._generating = False
+                self.progress.stop()
+                self.progress.grid_remove()
+                self.generate_button.state(["!disabled"])
+                on_done(value)
+                return
+            self.after(50, pump)
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.after(50, pump)
+
     # ------------------------------------------------------------------
     def _collect_data(self) -> PokemonData:
+        self._load_pending_tabs()
+        self._flush_species_selection()
         species = normalize_species_constant(self.species_var.get())
         if not species:
             raise ValueError("Species constant is required.")
@@ -1015,8 +1581,8 @@ class PokemonApp(tk.Tk):
         if not cry:
             raise ValueError("Please select a cry.")
 
-        base_stats = {stat: int(self.base_stat_vars[stat].get()) for stat in self.base_stat_vars}
-        ev_yield = {stat: int(self.ev_vars[stat].get()) for stat in self.ev_vars}
+        base_stats = {stat: int(var.get()) for stat, var in zip(STAT_NAMES, self._base_stat_var_order)}
+        ev_yield = {stat: int(var.get()) for stat, var in zip(STAT_NAMES, self._ev_var_order)}
 
         types = [self.type1_var.get().strip(), self.type2_var.get().strip()]
         types = [typ for typ in types if typ]
@@ -1042,26 +1608,19 @@ class PokemonApp(tk.Tk):
         icon_pal_index = self.icon_palette_var.get().strip()
         icon_pal = int(icon_pal_index) if icon_pal_index else None
 
-        learnset_level = [LearnsetEntry(entry.level, entry.move) for entry in self.level_moves_state.entries]
+        # Entries are never mutated in place, so shallow copies keep the form free to change
+        # while generation runs on its worker thread.
+        learnset_level = list(self.level_moves_state.entries)
         learnset_egg = list(self.egg_moves)
         learnset_tm = list(self.tm_moves)
 
         height = int(self.height_var.get())
         weight = int(self.weight_var.get())
-        description = self.description_text.get("1.0", tk.END).strip()
+        description = self._description()
         if not description:
             raise ValueError("Pokédex description is required.")
 
-        evolutions = [
-            EvolutionEntry(
-                from_species=entry.from_species,
-                method=entry.method,
-                parameter=entry.parameter,
-                target_species=entry.target_species,
-                conditions=list(entry.conditions),
-            )
-            for entry in self.evolutions
-        ]
+        evolutions = list(self.evolutions)
 
         graphics_folder = self.graphics_folder_var.get().strip() or showdown_folder_from_species(species)
 
@@ -1100,32 +1659,29 @@ class PokemonApp(tk.Tk):
 
     # ------------------------------------------------------------------
     def _build_asset_bundle(self) -> AssetBundle:
-        missing = [label for label, (key, _) in REQUIRED_ASSETS.items() if not self.asset_vars.get(key, tk.StringVar()).get()]
+        # Each StringVar.get() is a Tcl call, so every asset field is read exactly once.
+        values = {key: var.get() for key, var in self.asset_vars.items()}
+        missing = [label for label, (key, _) in REQUIRED_ASSETS.items() if not values.get(key)]
         if missing:
             raise ValueError(f"Missing required asset(s): {', '.join(missing)}")
 
         optional_assets: Dict[str, Path] = {}
         for label, (key, _) in OPTIONAL_ASSETS.items():
-            value = self.asset_vars.get(key)
-            if not value:
-                continue
-            path = value.get().strip()
-            if not path:
-                continue
-            if key.endswith(".png"):
+            path = values.get(key, "").strip()
+            if path and key.endswith(".png"):
                 optional_assets[key] = Path(path)
 
-        shiny_var = self.asset_vars.get("shiny_palette")
-        shiny_path = Path(shiny_var.get()) if shiny_var and shiny_var.get().strip() else None
+        shiny_value = values.get("shiny_palette", "")
+        shiny_path = Path(shiny_value) if shiny_value.strip() else None
 
-        cry_var = self.asset_vars.get("cry_sample")
-        cry_path = Path(cry_var.get()) if cry_var and cry_var.get().strip() else None
+        cry_value = values.get("cry_sample", "")
+        cry_path = Path(cry_value) if cry_value.strip() else None
 
         bundle = AssetBundle(
-            front=Path(self.asset_vars["front"].get()),
-            back=Path(self.asset_vars["back"].get()),
-            icon=Path(self.asset_vars["icon"].get()),
-            normal_palette=Path(self.asset_vars["normal_palette"].get()),
+            front=Path(values["front"]),
+            back=Path(values["back"]),
+            icon=Path(values["icon"]),
+            normal_palette=Path(values["normal_palette"]),
             shiny_palette=shiny_path,
             optional_assets=optional_assets,
             cry_sample=cry_path,
@@ -1133,8 +1689,8 @@ class PokemonApp(tk.Tk):
         return bundle
 
     # ------------------------------------------------------------------
-    def _apply_changes(self, data: PokemonData, assets: AssetBundle) -> None:
-        generate_pokemon_assets(data, assets, logger=self.log)
+    def _apply_changes(self, data: PokemonData, assets: AssetBundle, logger: Callable[[str], None]) -> None:
+        generate_pokemon_assets(data, assets, logger=logger)
 
 
 def main(argv: Optional[List[str]] = None) -> None:
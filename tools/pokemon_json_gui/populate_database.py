@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
+import argparse
 import ast
+import functools
+import hashlib
+import itertools
+import os
+import pickle
 import re
 import subprocess
+import sys
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import AbstractSet, Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 try:
     from . import project_paths
@@ -38,14 +46,46 @@ except ImportError:  # pragma: no cover - executed when run as a script
     from file_manager import AssetBundle  # type: ignore
 
 
-SPECIES_MARKER = "[SPECIES_"
 PREPROC_HEADER = (
+    # Pre-defining the guard keeps MOVE_* constants symbolic in egg and teachable learnsets.
+    "#define GUARD_CONSTANTS_MOVES_H\n"
     "#include \"gba/defines.h\"\n"
     "#include \"config/general.h\"\n"
     "#include \"config/pokemon.h\"\n"
     "#include \"config/species_enabled.h\"\n"
     "#include \"constants/pokemon.h\"\n"
 )
+CPP_CACHE_PATH = project_paths.CACHE_DIR / "cpp_batch.pkl"
+POPULATE_FINGERPRINT_KEY = "populate_fingerprint"
+# Bump when the stored row format changes in a way the tool sources below do not capture.
+POPULATE_FORMAT_VERSION = 1
+# Modules that shape the populated rows; hashed by content so checkouts agree on the key.
+POPULATE_TOOL_MODULES = (
+    "constants_loader.py",
+    "data_models.py",
+    "database.py",
+    "file_manager.py",
+    "populate_database.py",
+)
+CPP_DEPFILE_SPLIT_REGEX = re.compile(r"(?<!\\)\s+")
+CPP_FILE_SENTINEL = "@@POKEMON_JSON_GUI_FILE"
+CPP_FILE_SENTINEL_REGEX = re.compile(rf"^{CPP_FILE_SENTINEL} (\d+)[ \t]*$", re.MULTILINE)
+FAMILY_LINE_REGEX = re.compile(
+    rb"[#\[](?:if (?P<family>P_FAMILY_\S*)|(?P<endif>endif[^\n]*)|(?P<species>SPECIES_[^\]\n]*)\])"
+)
+FAMILY_GUARD_BYTES_REGEX = re.compile(rb"#if (P_FAMILY_\w+)")
+SPECIES_HEADER_REGEX = re.compile(r"\[(SPECIES_[A-Z0-9_]+)\]\s*=")
+# The body runs up to the first "};" without a lazy DOTALL scan; a ';' may only appear after a non-'}'.
+LEVEL_UP_ARRAY_REGEX = re.compile(
+    r"static const struct LevelUpMove\s+(?P<name>\w+)\[\]\s*=\s*\{(?P<body>[^;]*(?:;(?<!\};)[^;]*)*)\};"
+)
+LEVEL_UP_SKIPPED_MOVES = frozenset({"MOVE_UNAVAILABLE", "LEVEL_UP_MOVE_END", "MOVE_NONE"})
+LEVEL_UP_MOVE_REGEX = re.compile(r"\.move\s*=\s*([^,]+),\s*\.level\s*=\s*([^,}]+)")
+LEVEL_UP_MACRO_REGEX = re.compile(r"LEVEL_UP_MOVE\s*\(([^,]+),\s*([^\)]+)\)")
+MOVE_ARRAY_REGEX = re.compile(
+    r"static const u16\s+(?P<name>\w+)\[\]\s*=\s*\{(?P<body>.*?)\};",
+    re.DOTALL,
+)
 EV_YIELD_FIELDS = [
     ("evYield_HP", "hp"),
     ("evYield_Attack", "attack"),
@@ -56,32 +96,43 @@ EV_YIELD_FIELDS = [
 ]
 
 
-def _species_family_mapping() -> Dict[str, str]:
+def _scan_family_header(path: Path, enabled_guards: Optional[AbstractSet[bytes]]) -> Dict[str, str]:
     mapping: Dict[str, str] = {}
-    for path in sorted(project_paths.SPECIES_INFO_DIR.glob("*.h")):
-        current_family: Optional[str] = None
-        for line in path.read_text(encoding="utf-8").splitlines():
-            stripped = line.strip()
-            if stripped.startswith("#if P_FAMILY_"):
-                parts = stripped.split()
-                if parts:
-                    current_family = parts[1]
-                continue
-            if stripped.startswith("#endif"):
-                if "P_FAMILY_" in stripped:
-                    current_family = None
-                continue
-            if stripped.startswith(SPECIES_MARKER) and current_family:
-                end = stripped.find("]")
-                if end != -1:
-                    species_name = stripped[len("[") : end]
-                    mapping[species_name] = current_family
+    data = path.read_bytes()
+    # Files whose families are all disabled can only contribute species that get dropped.
+    if enabled_guards is not None and enabled_guards.isdisjoint(FAMILY_GUARD_BYTES_REGEX.findall(data)):
+        return mapping
+    current_family: Optional[str] = None
+    # Only family guards and species headers matter; the regex skips everything else on the
+    # raw bytes and only the captured names are decoded.
+    for match in FAMILY_LINE_REGEX.finditer(data):
+        start = match.start()
+        if data[data.rfind(b"\n", 0, start) + 1 : start].strip():
+            continue
+        family, endif, species = match.group("family", "endif", "species")
+        if family is not None:
+            # Interned so the hundreds of repeats share one object and compare by identity.
+            current_family = sys.intern(family.decode("utf-8"))
+        elif endif is not None:
+            if b"P_FAMILY_" in endif:
+                current_family = None
+        elif current_family:
+            mapping[sys.intern(species.decode("utf-8"))] = current_family
+    return mapping
+
+
+def _species_family_mapping(enabled_families: Optional[AbstractSet[str]] = None) -> Dict[str, str]:
+    enabled_guards = None if enabled_families is None else {family.encode() for family in enabled_families}
+    paths = sorted(project_paths.SPECIES_INFO_DIR.glob("*.h"))
+    mapping: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(paths) or 1)) as executor:
+        # map() yields in submission order, so later headers still win on duplicates.
+        for entries in executor.map(_scan_family_header, paths, itertools.repeat(enabled_guards)):
+            mapping.update(entries)
     return mapping
 
 
-def _collect_enabled_species() -> List[str]:
-    enabled_families = set(load_enabled_family_macros())
-    mapping = _species_family_mapping()
+def _collect_enabled_species(mapping: Dict[str, str], enabled_families: AbstractSet[str]) -> List[str]:
     return [species for species, family in mapping.items() if family in enabled_families]
 
 
@@ -143,37 +194,31 @@ def _custom_species_source() -> Optional[str]:
     )
 
 
-def _load_custom_species_info(header: Path) -> Dict[str, Dict[str, str]]:
-    source = _custom_species_source()
-    if source is None:
-        return {}
-
-    with tempfile.NamedTemporaryFile("w", suffix=".h", encoding="utf-8", delete=False) as handle:
-        temp_path = Path(handle.name)
-        handle.write(source)
-
+@functools.lru_cache(maxsize=None)
+def _directory_names(path: Path) -> FrozenSet[str]:
+    # One scandir per graphics directory instead of a stat per candidate name.
     try:
-        text = _run_cpp(temp_path, header)
-    finally:
-        try:
-            temp_path.unlink()
-        except FileNotFoundError:  # pragma: no cover - cleanup best effort
-            pass
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries)
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
 
-    return _parse_species_info_text(text)
+
+def _child_exists(base: Path, name: str) -> bool:
+    return name in _directory_names(base)
 
 
 def _pick_existing(base: Path, names: Iterable[str]) -> Optional[Path]:
     for name in names:
-        candidate = base / name
-        if candidate.exists():
-            return candidate
+        if _child_exists(base, name):
+            return base / name
     return None
 
 
 def _resolve_asset_folder(folder: str) -> Optional[Tuple[Path, Path]]:
-    direct = project_paths.GRAPHICS_ROOT / folder
-    if direct.exists():
+    root = project_paths.GRAPHICS_ROOT
+    if _child_exists(root, folder):
+        direct = root / folder
         return direct, direct
 
     parts = folder.split('_')
@@ -182,25 +227,23 @@ def _resolve_asset_folder(folder: str) -> Optional[Tuple[Path, Path]]:
 
     def _search(current: Path, remaining: List[str]) -> Optional[Path]:
         if not remaining:
-            return current if current.exists() else None
+            return current
         joined = '_'.join(remaining)
-        candidate = current / joined
-        if candidate.exists():
-            return candidate
+        if _child_exists(current, joined):
+            return current / joined
         for index in range(1, len(remaining) + 1):
             prefix = '_'.join(remaining[:index])
-            candidate = current / prefix
-            if candidate.exists():
-                result = _search(candidate, remaining[index:])
+            if _child_exists(current, prefix):
+                result = _search(current / prefix, remaining[index:])
                 if result is not None:
                     return result
         return None
 
     for prefix_len in range(len(parts), 0, -1):
         base_name = '_'.join(parts[:prefix_len])
-        base_path = project_paths.GRAPHICS_ROOT / base_name
-        if not base_path.exists():
+        if not _child_exists(root, base_name):
             continue
+        base_path = root / base_name
         remainder = parts[prefix_len:]
         resolved = _search(base_path, remainder)
         if resolved is not None:
@@ -209,12 +252,11 @@ def _resolve_asset_folder(folder: str) -> Optional[Tuple[Path, Path]]:
     return None
 
 
-def _build_asset_bundle(folder: str) -> Optional[AssetBundle]:
-    resolved = _resolve_asset_folder(folder)
-    if resolved is None:
-        return None
+BundlePaths = Tuple[Path, Path, Path, Path, Optional[Path]]
 
-    asset_base, fallback_base = resolved
+
+@functools.lru_cache(maxsize=None)
+def _find_bundle_paths(asset_base: Path, fallback_base: Path) -> Optional[BundlePaths]:
     search_paths = [asset_base]
     if fallback_base not in search_paths:
         search_paths.append(fallback_base)
@@ -244,18 +286,30 @@ def _build_asset_bundle(folder: str) -> Optional[AssetBundle]:
     if not all((front, back, icon, normal_pal)):
         return None
     shiny_pal = find_asset(("shiny.pal", "shiny_gba.pal"))
+    return front, back, icon, normal_pal, shiny_pal  # type: ignore[return-value]
+
+
+def _build_asset_bundle(folder: str) -> Optional[AssetBundle]:
+    resolved = _resolve_asset_folder(folder)
+    if resolved is None:
+        return None
+    # Forms that fall back to a shared folder (Alcremie, Vivillon, ...) reuse the lookup.
+    paths = _find_bundle_paths(*resolved)
+    if paths is None:
+        return None
+    front, back, icon, normal_pal, shiny_pal = paths
     return AssetBundle(
-        front=front,  # type: ignore[arg-type]
-        back=back,  # type: ignore[arg-type]
-        icon=icon,  # type: ignore[arg-type]
-        normal_palette=normal_pal,  # type: ignore[arg-type]
+        front=front,
+        back=back,
+        icon=icon,
+        normal_palette=normal_pal,
         shiny_palette=shiny_pal,
         optional_assets={},
         cry_sample=None,
     )
 
 
-def _run_cpp(path: Path, header: Path) -> str:
+def _run_cpp(path: Path, header: Path, depfile: Optional[Path] = None) -> str:
     include_root = project_paths.REPO_ROOT / "include"
     include_args = [
         "-I",
@@ -266,79 +320,150 @@ def _run_cpp(path: Path, header: Path) -> str:
         str(include_root / "constants"),
     ]
     command = ["cpp", "-P", f"-include{header}"] + include_args + [str(path)]
-    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    if depfile is not None:
+        command += ["-MD", "-MF", str(depfile)]
+    # Capture bytes and decode once; text mode would stream the whole output through a decoder.
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
     if result.returncode != 0:
-        raise RuntimeError(f"cpp failed for {path}: {result.stderr.strip()}")
-    return result.stdout
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        raise RuntimeError(f"cpp failed for {path}: {stderr}")
+    output = result.stdout
+    if b"\r" in output:
+        output = output.replace(b"\r\n", b"\n")
+    return output.decode("utf-8")
+
+
+def _read_depfile(depfile: Path) -> List[str]:
+    text = depfile.read_text(encoding="utf-8").replace("\\\n", " ")
+    _, _, deps = text.partition(": ")
+    return [dep.replace("\\ ", " ") for dep in CPP_DEPFILE_SPLIT_REGEX.split(deps.strip()) if dep]
+
+
+def _dependency_key(paths: Iterable[str]) -> Tuple[Tuple[str, int, int], ...]:
+    key = []
+    for path in paths:
+        stat = os.stat(path)
+        key.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+
+def _cached_cpp_batch(request: Tuple[Any, ...]) -> Optional[List[str]]:
+    try:
+        with CPP_CACHE_PATH.open("rb") as handle:
+            cached_request, dependencies, texts = pickle.load(handle)
+        if cached_request == request and _dependency_key(path for path, _, _ in dependencies) == dependencies:
+            return texts
+    except Exception:  # Missing, truncated, or a header has since been removed.
+        pass
+    return None
+
+
+def _store_cpp_batch(request: Tuple[Any, ...], dependencies: List[str], texts: List[str]) -> None:
+    try:
+        payload = (request, _dependency_key(dependencies), texts)
+        CPP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = CPP_CACHE_PATH.with_suffix(".tmp")
+        with temp_path.open("wb") as handle:
+            pickle.dump(payload, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        temp_path.replace(CPP_CACHE_PATH)
+    except OSError:  # pragma: no cover - the cpp cache is best effort
+        pass
+
+
+def _run_cpp_batch(paths: Sequence[Path], header: Path) -> List[str]:
+    """Preprocess every path in a single cpp run and return each file's output, in order.
+
+    The output is cached under the build directory and reused while every header cpp
+    read keeps its mtime and size.
+    """
+    temp_dir = header.parent
+    # Files in the temporary directory move between runs, so their contents stand in for them.
+    request = (
+        header.read_text(encoding="utf-8"),
+        tuple(path.read_text(encoding="utf-8") if path.parent == temp_dir else str(path) for path in paths),
+    )
+    cached = _cached_cpp_batch(request)
+    if cached is not None:
+        return cached
+
+    umbrella = header.with_name("preproc_batch.h")
+    umbrella.write_text(
+        "".join(f"{CPP_FILE_SENTINEL} {index}\n#include \"{path}\"\n" for index, path in enumerate(paths)),
+        encoding="utf-8",
+    )
+    # The sentinels survive preprocessing as plain tokens; output before the first one
+    # belongs to the forced-include header.
+    depfile = header.with_name("preproc_batch.d")
+    pieces = CPP_FILE_SENTINEL_REGEX.split(_run_cpp(umbrella, header, depfile))
+    texts = [""] * len(paths)
+    for index, text in zip(pieces[1::2], pieces[2::2]):
+        texts[int(index)] = text
+    temp_root = str(temp_dir)
+    dependencies = [dep for dep in _read_depfile(depfile) if os.path.dirname(dep) != temp_root]
+    _store_cpp_batch(request, dependencies, texts)
+    return texts
+
+
+# A string literal (running to the end of the text if unterminated) or one structural character.
+BRACKET_SCAN_REGEX = re.compile(r'"(?:[^"\\]|\\.)*(?:"|\\?\Z)|[(){},]', re.DOTALL)
+BRACKET_CHAR_REGEX = re.compile(r"[(){}]")
+BRACKET_DELTAS = {"(": (1, 0), ")": (-1, 0), "{": (0, 1), "}": (0, -1)}
 
 
 def _count_brackets(text: str, paren: int, brace: int) -> Tuple[int, int]:
-    in_string = False
-    escape = False
-    for char in text:
-        if char == "\"" and not escape:
-            in_string = not in_string
-        if in_string:
-            escape = char == "\\" and not escape
-            continue
-        escape = False
-        if char == "(":
-            paren += 1
-        elif char == ")":
-            paren -= 1
-        elif char == "{":
-            brace += 1
-        elif char == "}":
-            brace -= 1
+    if '"' not in text:
+        return (
+            paren + text.count("(") - text.count(")"),
+            brace + text.count("{") - text.count("}"),
+        )
+    for match in BRACKET_SCAN_REGEX.finditer(text):
+        delta = BRACKET_DELTAS.get(match.group())
+        if delta is not None:
+            paren += delta[0]
+            brace += delta[1]
     return paren, brace
 
 
 def _split_top_level(text: str) -> List[str]:
+    if not any(char in text for char in '"(){}'):
+        return [part for part in map(str.strip, text.split(",")) if part]
     parts: List[str] = []
-    current: List[str] = []
+    start = 0
     paren = brace = 0
-    in_string = False
-    escape = False
-    for char in text:
-        if char == "\"" and not escape:
-            in_string = not in_string
-        if in_string:
-            escape = char == "\\" and not escape
-            current.append(char)
+    for match in BRACKET_SCAN_REGEX.finditer(text):
+        token = match.group()
+        if token == ",":
+            if paren == 0 and brace == 0:
+                part = text[start : match.start()].strip()
+                if part:
+                    parts.append(part)
+                start = match.end()
             continue
-        escape = False
-        if char == "(":
-            paren += 1
-        elif char == ")":
-            paren -= 1
-        elif char == "{":
-            brace += 1
-        elif char == "}":
-            brace -= 1
-        if char == "," and paren == 0 and brace == 0:
-            part = "".join(current).strip()
-            if part:
-                parts.append(part)
-            current = []
-        else:
-            current.append(char)
-    tail = "".join(current).strip()
+        delta = BRACKET_DELTAS.get(token)
+        if delta is not None:
+            paren += delta[0]
+            brace += delta[1]
+    tail = text[start:].strip()
     if tail:
         parts.append(tail)
     return parts
 
 
+def _logical_lines(lines: Iterable[str]) -> Iterator[str]:
+    # Split "a = 1, .b = 2" style lines without rebuilding the whole block.
+    for raw_line in lines:
+        if ', .' in raw_line:
+            yield from raw_line.replace(', .', ',\n.').split('\n')
+        else:
+            yield raw_line
+
+
 def _parse_block_assignments(lines: Sequence[str]) -> Dict[str, str]:
     assignments: Dict[str, str] = {}
     current_field: Optional[str] = None
     buffer: List[str] = []
     paren = brace = 0
-    expanded_lines: List[str] = []
-    for raw_line in lines:
-        if ', .' in raw_line:
-            raw_line = raw_line.replace(', .', ',\n        .')
-        expanded_lines.extend(raw_line.splitlines())
-    for raw_line in expanded_lines:
+    for raw_line in _logical_lines(lines):
         stripped = raw_line.strip()
         if not stripped:
             continue
@@ -349,22 +474,20 @@ def _parse_block_assignments(lines: Sequence[str]) -> Dict[str, str]:
             current_field = field_part.strip()
             value = value_part.strip()
             has_comma = value.endswith(',')
-            if has_comma:
-                value = value[:-1].strip()
+            value = value[:-1].rstrip() if has_comma else value
             buffer = [value]
-            paren, brace = _count_brackets(value, 0, 0)
+            paren, brace = _count_brackets(value, 0, 0) if BRACKET_CHAR_REGEX.search(value) else (0, 0)
             if paren == 0 and brace == 0 and has_comma:
                 assignments[current_field] = value
                 current_field = None
                 buffer = []
                 paren = brace = 0
         else:
-            value = stripped
-            has_comma = value.endswith(',')
-            if has_comma:
-                value = value[:-1].strip()
+            has_comma = stripped.endswith(',')
+            value = stripped[:-1].rstrip() if has_comma else stripped
             buffer.append(value)
-            paren, brace = _count_brackets(value, paren, brace)
+            if BRACKET_CHAR_REGEX.search(value):
+                paren, brace = _count_brackets(value, paren, brace)
             if paren == 0 and brace == 0 and has_comma:
                 assignments[current_field] = " ".join(buffer).strip()
                 current_field = None
@@ -381,7 +504,7 @@ def _parse_species_info_text(text: str) -> Dict[str, Dict[str, str]]:
     index = 0
     while index < len(lines):
         stripped = lines[index].strip()
-        match = re.match(r"\[(SPECIES_[A-Z0-9_]+)\]\s*=", stripped)
+        match = SPECIES_HEADER_REGEX.match(stripped)
         if not match:
             index += 1
             continue
@@ -411,6 +534,7 @@ def _parse_species_info_text(text: str) -> Dict[str, Dict[str, str]]:
     return result
 
 
+@functools.lru_cache(maxsize=4096)
 def _extract_string(value: str) -> str:
     if not value:
         return ""
@@ -425,6 +549,7 @@ def _extract_string(value: str) -> str:
     return "".join(ast.literal_eval(token) for token in strings)
 
 
+@functools.lru_cache(maxsize=4096)
 def _parse_compound_string(value: str) -> str:
     if not value:
         return ""
@@ -468,6 +593,7 @@ TOKEN_REGEX = re.compile(
     r"|(?P<WS>\s+)"
 )
 IDENT_VALUES = {"TRUE": 1, "FALSE": 0}
+NUMBER_LITERAL_REGEX = re.compile(r"0x[0-9A-Fa-f]+|\d+")
 
 
 def _tokenize_expression(expr: str) -> List[Tuple[str, object]]:
@@ -497,6 +623,8 @@ def _tokenize_expression(expr: str) -> List[Tuple[str, object]]:
 
 
 class _TokenStream:
+    __slots__ = ("_tokens", "_index")
+
     def __init__(self, tokens: List[Tuple[str, object]]):
         self._tokens = tokens
         self._index = 0
@@ -510,8 +638,7 @@ class _TokenStream:
         return token
 
     def peek_value(self, value: str) -> bool:
-        token = self.peek()
-        return token[1] == value
+        return self._tokens[self._index][1] == value
 
     def expect(self, value: str) -> None:
         token = self.next()
@@ -677,16 +804,41 @@ def _parse_primary(stream: _TokenStream) -> int:
     raise ValueError(f"Unexpected token in expression: {token}")
 
 
+@functools.lru_cache(maxsize=4096)
 def _evaluate_numeric(expr: str) -> int:
     text = expr.strip()
     if not text:
         return 0
+    # Almost every field is a bare literal; skip the tokenizer and parser for those.
+    if NUMBER_LITERAL_REGEX.fullmatch(text):
+        return int(text, 0)
     tokens = _tokenize_expression(text)
     stream = _TokenStream(tokens)
     value = _parse_expression(stream)
     return int(value)
 
 
+BRACE_REGEX = re.compile(r"[{}]")
+
+
+def _top_level_brace_bodies(text: str) -> List[str]:
+    # Only the braces themselves are visited; the text between them is sliced, not walked.
+    bodies: List[str] = []
+    depth = 0
+    start: Optional[int] = None
+    for match in BRACE_REGEX.finditer(text):
+        if match.group() == '{':
+            if depth == 0:
+                start = match.end()
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0 and start is not None:
+                bodies.append(text[start : match.start()])
+                start = None
+    return bodies
+
+
 def _parse_evolutions(value: str) -> List[Tuple[str, str, str, List[str]]]:
     if not value:
         return []
@@ -699,97 +851,51 @@ def _parse_evolutions(value: str) -> List[Tuple[str, str, str, List[str]]]:
         if start != -1 and end != -1:
             text = text[start + 1 : end]
     entries: List[Tuple[str, str, str, List[str]]] = []
-    current: List[str] = []
-    brace_depth = 0
-    for char in text:
-        if char == '{':
-            if brace_depth == 0:
-                current = []
-            brace_depth += 1
-        if brace_depth > 0:
-            current.append(char)
-        if char == '}':
-            brace_depth -= 1
-            if brace_depth == 0:
-                entry_text = ''.join(current).strip()
-                if entry_text.startswith('{') and entry_text.endswith('}'):
-                    entry_text = entry_text[1:-1]
-                parts = [part.strip() for part in _split_top_level(entry_text) if part.strip()]
-                if len(parts) < 3:
+    for entry_text in _top_level_brace_bodies(text):
+        parts = [part.strip() for part in _split_top_level(entry_text) if part.strip()]
+        if len(parts) < 3:
+            continue
+        method, parameter, target, *rest = parts
+        conditions: List[str] = []
+        for extra in rest:
+            if extra.startswith('CONDITIONS'):
+                start = extra.find('(')
+                end = extra.rfind(')')
+                if start == -1 or end == -1:
                     continue
-                method, parameter, target, *rest = parts
-                conditions: List[str] = []
-                for extra in rest:
-                    if extra.startswith('CONDITIONS'):
-                        start = extra.find('(')
-                        end = extra.rfind(')')
-                        if start == -1 or end == -1:
-                            continue
-                        condition_block = extra[start + 1 : end]
-                        inner_entries: List[str] = []
-                        depth = 0
-                        start_idx: Optional[int] = None
-                        for idx, token in enumerate(condition_block):
-                            if token == '{':
-                                if depth == 0:
-                                    start_idx = idx + 1
-                                depth += 1
-                            elif token == '}':
-                                depth -= 1
-                                if depth == 0 and start_idx is not None:
-                                    inner_entries.append(condition_block[start_idx:idx])
-                                    start_idx = None
-                        for condition in inner_entries:
-                            cond_parts = [part.strip() for part in _split_top_level(condition) if part.strip()]
-                            if cond_parts:
-                                conditions.append(' '.join(cond_parts))
-                    else:
-                        conditions.append(extra)
-                entries.append((method, parameter, target, conditions))
+                for condition in _top_level_brace_bodies(extra[start + 1 : end]):
+                    cond_parts = [part.strip() for part in _split_top_level(condition) if part.strip()]
+                    if cond_parts:
+                        conditions.append(' '.join(cond_parts))
+            else:
+                conditions.append(extra)
+        entries.append((method, parameter, target, conditions))
     return entries
 
 
-def _parse_level_up_learnsets(header: Path) -> Dict[str, List[LearnsetEntry]]:
-    directory = project_paths.REPO_ROOT / "src" / "data" / "pokemon" / "level_up_learnsets"
-    array_pattern = r"static const struct LevelUpMove\s+(?P<name>\w+)\[\]\s*=\s*\{(?P<body>.*?)\};"
-    move_pattern = re.compile(r"\.move\s*=\s*([^,]+),\s*\.level\s*=\s*([^,}]+)")
-    macro_pattern = re.compile(r"LEVEL_UP_MOVE\s*\(([^,]+),\s*([^\)]+)\)")
+def _parse_level_up_learnsets(texts: Iterable[str]) -> Dict[str, List[LearnsetEntry]]:
     learnsets: Dict[str, List[LearnsetEntry]] = {}
-    for path in sorted(directory.glob("*.h")):
-        text = _run_cpp(path, header)
-        for match in re.finditer(array_pattern, text, re.DOTALL):
-            name = match.group('name')
-            body = match.group('body')
+    for text in texts:
+        for name, body in LEVEL_UP_ARRAY_REGEX.findall(text):
             entries: List[LearnsetEntry] = []
-            for move_match in move_pattern.finditer(body):
-                move = move_match.group(1).strip()
-                level_text = move_match.group(2).strip()
-                if move in {"MOVE_UNAVAILABLE", "LEVEL_UP_MOVE_END"} or move.startswith("0x"):
-                    continue
-                if move == "MOVE_NONE":
+            for move, level_text in LEVEL_UP_MOVE_REGEX.findall(body):
+                move = move.strip()
+                if move in LEVEL_UP_SKIPPED_MOVES or move.startswith("0x"):
                     continue
-                level = _evaluate_numeric(level_text)
-                entries.append(LearnsetEntry(level=level, move=move))
+                entries.append(LearnsetEntry(level=_evaluate_numeric(level_text.strip()), move=move))
             if not entries:
-                for move_match in macro_pattern.finditer(body):
-                    level_text = move_match.group(1).strip()
-                    move = move_match.group(2).strip()
-                    if move in {"MOVE_UNAVAILABLE", "LEVEL_UP_MOVE_END", "MOVE_NONE"}:
+                for level_text, move in LEVEL_UP_MACRO_REGEX.findall(body):
+                    move = move.strip()
+                    if move in LEVEL_UP_SKIPPED_MOVES:
                         continue
-                    level = _evaluate_numeric(level_text)
-                    entries.append(LearnsetEntry(level=level, move=move))
+                    entries.append(LearnsetEntry(level=_evaluate_numeric(level_text.strip()), move=move))
             learnsets[name] = entries
     return learnsets
 
 
-def _parse_move_learnsets(path: Path, header: Path) -> Dict[str, List[str]]:
-    text = _run_cpp(path, header)
-    array_pattern = re.compile(
-        r"static const u16\\s+(?P<name>\\w+)\\[\\]\\s*=\\s*\\{(?P<body>.*?)\\};",
-        re.DOTALL,
-    )
+def _parse_move_learnsets(text: str) -> Dict[str, List[str]]:
     learnsets: Dict[str, List[str]] = {}
-    for match in array_pattern.finditer(text):
+    for match in MOVE_ARRAY_REGEX.finditer(text):
         name = match.group('name')
         body = match.group('body')
         moves: List[str] = []
@@ -828,43 +934,97 @@ def _ensure_two_egg_groups(groups: List[str]) -> List[str]:
     return groups[:2]
 
 
-def populate_database(database: PokemonDatabase) -> None:
+def _populate_fingerprint() -> str:
+    """Hash the stat of every populate input so unchanged projects can skip the rebuild."""
+    repo_root = project_paths.REPO_ROOT
+    sources = sorted(
+        itertools.chain(
+            (repo_root / "include").rglob("*.h"),
+            (repo_root / "src" / "data" / "pokemon").rglob("*.h"),
+        )
+    )
+    # Asset lookups only test which names exist, so directory stats cover the graphics.
+    graphics = sorted(root for root, _, _ in os.walk(project_paths.GRAPHICS_ROOT))
+    key = _dependency_key([*map(os.fspath, sources), *graphics])
+    digest = hashlib.sha256(f"format-{POPULATE_FORMAT_VERSION}".encode("utf-8"))
+    tool_dir = Path(__file__).resolve().parent
+    for module in POPULATE_TOOL_MODULES:
+        digest.update((tool_dir / module).read_bytes())
+    digest.update(repr(key).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def populate_database(database: PokemonDatabase, *, force: bool = False) -> None:
     _ = load_species_metadata()  # Ensures data dependencies are generated if necessary.
-    species_list = _collect_enabled_species()
-    family_map = _species_family_mapping()
+    fingerprint = _populate_fingerprint()
+    if not force and database.get_meta(POPULATE_FINGERPRINT_KEY) == fingerprint:
+        print("Project sources and graphics are unchanged since the last populate; skipping (use --force to rebuild).")
+        return
+    # Graphics may have changed since the last run.
+    _directory_names.cache_clear()
+    _find_bundle_paths.cache_clear()
+    # Scanned once and shared; the species headers are read a single time per populate.
+    enabled_families = set(map(sys.intern, load_enabled_family_macros()))
+    family_map = _species_family_mapping(enabled_families)
+    species_list = _collect_enabled_species(family_map, enabled_families)
 
     with tempfile.TemporaryDirectory() as temp_dir:
         header_path = Path(temp_dir) / "preproc_config.h"
         header_path.write_text(PREPROC_HEADER, encoding="utf-8")
 
+        pokemon_data_dir = project_paths.REPO_ROOT / "src" / "data" / "pokemon"
+        species_paths = sorted(project_paths.SPECIES_INFO_DIR.glob("*_families.h"))
+        level_up_paths = sorted((pokemon_data_dir / "level_up_learnsets").glob("*.h"))
+        move_paths = [pokemon_data_dir / "egg_moves.h", pokemon_data_dir / "teachable_learnsets.h"]
+        custom_paths: List[Path] = []
+        custom_source = _custom_species_source()
+        if custom_source is not None:
+            custom_path = Path(temp_dir) / "custom_species_info.h"
+            custom_path.write_text(custom_source, encoding="utf-8")
+            custom_paths.append(custom_path)
+
+        # One cpp process for every header instead of one per file.
+        texts = iter(_run_cpp_batch([*species_paths, *level_up_paths, *move_paths, *custom_paths], header_path))
+        species_texts = list(itertools.islice(texts, len(species_paths)))
+        level_up_texts = list(itertools.islice(texts, len(level_up_paths)))
+        egg_text, teachable_text = itertools.islice(texts, len(move_paths))
+        custom_texts = list(texts)
+
         species_info: Dict[str, Dict[str, str]] = {}
-        for path in sorted(project_paths.SPECIES_INFO_DIR.glob("*_families.h")):
-            text = _run_cpp(path, header_path)
+        for text in species_texts:
             species_info.update(_parse_species_info_text(text))
 
-        custom_species_info = _load_custom_species_info(header_path)
-        if custom_species_info:
+        for text in custom_texts:
+            custom_species_info = _parse_species_info_text(text)
             species_info.update(custom_species_info)
             for custom_species in custom_species_info:
                 if custom_species not in species_list:
                     species_list.append(custom_species)
 
-        level_up_learnsets = _parse_level_up_learnsets(header_path)
-        egg_move_learnsets = _parse_move_learnsets(
-            project_paths.REPO_ROOT / "src" / "data" / "pokemon" / "egg_moves.h",
-            header_path,
-        )
-        teachable_learnsets = _parse_move_learnsets(
-            project_paths.REPO_ROOT / "src" / "data" / "pokemon" / "teachable_learnsets.h",
-            header_path,
-        )
-
-        for species in species_list:
-            info = species_info.get(species)
-            if info is None:
+        level_up_learnsets = _parse_level_up_learnsets(level_up_texts)
+        egg_move_learnsets = _parse_move_learnsets(egg_text)
+        teachable_learnsets = _parse_move_learnsets(teachable_text)
+
+        # Probe the filesystem for every species up front so the directory scans overlap.
+        folders = {
+            species: showdown_folder_from_species(species) for species in species_list if species in species_info
+        }
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+            asset_bundles = dict(zip(folders, executor.map(_build_asset_bundle, folders.values())))
+
+        entries: List[Tuple[PokemonData, AssetBundle]] = []
+        skipped: List[str] = []
+        for species, folder in folders.items():
+            # Check assets first so species that will be skipped are never parsed.
+            assets = asset_bundles[species]
+            if assets is None:
+                skipped.append(species)
                 continue
-
-            family_macro = family_map.get(species, species.replace("SPECIES_", "P_FAMILY_"))
+            info = species_info[species]
+            # Only derive a fallback macro when the family headers did not map one.
+            family_macro = family_map.get(species)
+            if family_macro is None:
+                family_macro = species.replace("SPECIES_", "P_FAMILY_")
             display_name = _extract_string(info.get("speciesName", species))
             category_name = _extract_string(info.get("categoryName", ""))
             description = _parse_compound_string(info.get("description", ""))
@@ -891,13 +1051,13 @@ def populate_database(database: PokemonDatabase) -> None:
             }
             ev_yield = _build_ev_yield(info)
 
-            level_key = info.get("levelUpLearnset", "").strip()
-            level_moves = level_up_learnsets.get(level_key, [])
-            egg_key = info.get("eggMoveLearnset", "").strip()
-            egg_moves = egg_move_learnsets.get(egg_key, [])
-            teachable_key = info.get("teachableLearnset", "").strip()
-            teachable_moves = teachable_learnsets.get(teachable_key, [])
+            # _parse_block_assignments already strips values, and array names never carry whitespace.
+            level_moves = level_up_learnsets.get(info.get("levelUpLearnset", ""), [])
+            egg_moves = egg_move_learnsets.get(info.get("eggMoveLearnset", ""), [])
+            teachable_moves = teachable_learnsets.get(info.get("teachableLearnset", ""), [])
 
+            # Most species have no evolutions field; skip the parser and comprehension for them.
+            evolution_text = info.get("evolutions")
             evolutions = [
                 EvolutionEntry(
                     from_species=species,
@@ -906,8 +1066,8 @@ def populate_database(database: PokemonDatabase) -> None:
                     target_species=target,
                     conditions=conditions,
                 )
-                for method, parameter, target, conditions in _parse_evolutions(info.get("evolutions", ""))
-            ]
+                for method, parameter, target, conditions in _parse_evolutions(evolution_text)
+            ] if evolution_text else []
 
             natdex = info.get("natDexNum")
             if natdex:
@@ -924,12 +1084,6 @@ def populate_database(database: PokemonDatabase) -> None:
                 except ValueError:
                     icon_value = None
 
-            folder = showdown_folder_from_species(species)
-            assets = _build_asset_bundle(folder)
-            if assets is None:
-                print(f"Skipping {species} because required graphics assets are missing.")
-                continue
-
             pokemon = PokemonData(
                 species_constant=species,
                 family_macro=family_macro,
@@ -959,13 +1113,32 @@ def populate_database(database: PokemonDatabase) -> None:
                 graphics_folder=folder,
                 icon_pal_index=icon_value,
             )
-            database.save_entry(pokemon, assets)
+            entries.append((pokemon, assets))
 
+        if skipped:
+            # Reported once so large partial trees do not write a line per species.
+            print(
+                f"Skipping {len(skipped)} species because required graphics assets are missing: "
+                + ", ".join(skipped)
+            )
+
+    # One transaction for the whole run instead of an implicit commit per species.
+    database.save_many(entries)
+    database.set_meta(POPULATE_FINGERPRINT_KEY, fingerprint)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Populate the Pokémon database from the project sources.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild every entry even if the project is unchanged since the last populate.",
+    )
+    args = parser.parse_args(argv)
 
-def main() -> None:
     project_paths.ensure_directories()
     database = PokemonDatabase()
-    populate_database(database)
+    populate_database(database, force=args.force)
 
 
 if __name__ == "__main__":
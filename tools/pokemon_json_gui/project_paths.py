@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 DATA_JSON_ROOT = REPO_ROOT / "data" / "json" / "pokemon"
 GRAPHICS_ROOT = REPO_ROOT / "graphics" / "pokemon"
-DATABASE_PATH = REPO_ROOT / "build" / "pokemon_json_gui" / "pokemon.db"
+CACHE_DIR = REPO_ROOT / "build" / "pokemon_json_gui"
+DATABASE_PATH = CACHE_DIR / "pokemon.db"
 SPECIES_ENABLED_PATH = REPO_ROOT / "include" / "config" / "species_enabled.h"
 POKEDEX_ORDERS_PATH = REPO_ROOT / "src" / "data" / "pokemon" / "pokedex_orders.h"
 CRY_TABLE_PATH = REPO_ROOT / "sound" / "cry_tables.inc"
@@ -17,13 +19,23 @@ ITEMS_HEADER_PATH = REPO_ROOT / "include" / "constants" / "items.h"
 POKEMON_HEADER_PATH = REPO_ROOT / "include" / "constants" / "pokemon.h"
 
 _POKEMON_TYPES_HEADER_DEFAULT = REPO_ROOT / "include" / "constants" / "pokemon_types.h"
-if _POKEMON_TYPES_HEADER_DEFAULT.exists():
-    TYPES_HEADER_PATH = _POKEMON_TYPES_HEADER_DEFAULT
-else:
-    TYPES_HEADER_PATH = POKEMON_HEADER_PATH
 SPECIES_INFO_DIR = REPO_ROOT / "src" / "data" / "pokemon" / "species_info"
 
 
+@functools.lru_cache(maxsize=1)
+def _types_header_path() -> Path:
+    if _POKEMON_TYPES_HEADER_DEFAULT.exists():
+        return _POKEMON_TYPES_HEADER_DEFAULT
+    return POKEMON_HEADER_PATH
+
+
+def __getattr__(name: str) -> Path:
+    # TYPES_HEADER_PATH is resolved on first access so importing this module never stats.
+    if name == "TYPES_HEADER_PATH":
+        return _types_header_path()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def ensure_directories() -> None:
     DATA_JSON_ROOT.mkdir(parents=True, exist_ok=True)
     GRAPHICS_ROOT.mkdir(parents=True, exist_ok=True)